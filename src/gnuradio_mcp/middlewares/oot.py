@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import functools
 import io
 import json
 import logging
 import subprocess
 import tarfile
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import re
 
+from pydantic import TypeAdapter, ValidationError
+
 from gnuradio_mcp.models import (
     ComboImageInfo,
     ComboImageResult,
@@ -21,6 +25,17 @@ from gnuradio_mcp.models import (
 
 logger = logging.getLogger(__name__)
 
+# Registry (de)serializers: JSON parsing and model validation run in
+# pydantic-core in a single pass, without an intermediate dict walk.
+_REGISTRY_ADAPTER = TypeAdapter(dict[str, OOTImageInfo])
+_COMBO_REGISTRY_ADAPTER = TypeAdapter(dict[str, ComboImageInfo])
+
+# Last path segment of an HTTPS or scp-style SSH git URL, without any
+# trailing ".git" or slashes; "name" additionally drops a "gr-" prefix.
+_GIT_URL_RE = re.compile(
+    r"(?:.*[/:])?(?P<dir>(?:gr-)?(?P<name>[^/:]+?))(?:\.git)?/*"
+)
+
 DEFAULT_BASE_IMAGE = "gnuradio-runtime:latest"
 
 DOCKERFILE_TEMPLATE = """\
@@ -50,6 +65,9 @@ WORKDIR /flowgraphs
 ENV PYTHONPATH="/usr/lib/python3.11/site-packages:${{PYTHONPATH}}"
 """
 
+# Install prefixes copied from each single-OOT image into a combo image
+COMBO_COPY_PATHS = ("/usr/lib/", "/usr/include/", "/usr/share/gnuradio/")
+
 # Standalone script injected into OOT Docker builds to fix stale
 # pybind11 binding hashes that would otherwise trigger castxml regen.
 FIX_BINDING_HASHES_SCRIPT = """\
@@ -92,6 +110,18 @@ for bindings in binding_dirs:
 """
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a sibling temp file and rename.
+
+    A crash mid-write leaves the previous registry intact instead of a
+    truncated JSON file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
 class OOTInstallerMiddleware:
     """Builds OOT modules into Docker images from git repos.
 
@@ -252,34 +282,34 @@ class OOTInstallerMiddleware:
     # ──────────────────────────────────────────
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _module_name_from_url(url: str) -> str:
         """Extract module name from git URL.
 
         "https://github.com/tapparelj/gr-lora_sdr.git" -> "lora_sdr"
         "https://github.com/osmocom/gr-osmosdr" -> "osmosdr"
         "https://github.com/gnuradio/volk.git" -> "volk"
+        "git@github.com:bastibl/gr-foo.git" -> "foo"
+
+        Cached: combo builds resolve the same catalog URLs repeatedly.
         """
-        # Strip trailing .git and slashes
-        cleaned = url.rstrip("/")
-        if cleaned.endswith(".git"):
-            cleaned = cleaned[:-4]
-        # Get last path segment
-        name = cleaned.rsplit("/", 1)[-1]
-        # Strip gr- prefix if present
-        if name.startswith("gr-"):
-            name = name[3:]
-        return name
+        return OOTInstallerMiddleware._match_git_url(url).group("name")
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _repo_dir_from_url(url: str) -> str:
         """Get the directory name git clone will create.
 
         "https://github.com/tapparelj/gr-lora_sdr.git" -> "gr-lora_sdr"
         """
-        cleaned = url.rstrip("/")
-        if cleaned.endswith(".git"):
-            cleaned = cleaned[:-4]
-        return cleaned.rsplit("/", 1)[-1]
+        return OOTInstallerMiddleware._match_git_url(url).group("dir")
+
+    @staticmethod
+    def _match_git_url(url: str) -> re.Match[str]:
+        match = _GIT_URL_RE.fullmatch(url)
+        if match is None:
+            raise ValueError(f"Cannot determine repository name from '{url}'")
+        return match
 
     @staticmethod
     def _get_remote_commit(git_url: str, branch: str) -> str:
@@ -351,10 +381,19 @@ class OOTInstallerMiddleware:
         Validates entries individually so one corrupted entry
         doesn't discard the entire registry.
         """
-        if not self._registry_path.exists():
+        try:
+            raw = self._registry_path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.warning("Failed to read OOT registry: %s", e)
             return {}
         try:
-            data = json.loads(self._registry_path.read_text())
+            return _REGISTRY_ADAPTER.validate_json(raw)
+        except ValidationError:
+            pass  # Fall back to per-entry validation below
+        try:
+            data = json.loads(raw)
         except Exception as e:
             logger.warning("Failed to parse OOT registry JSON: %s", e)
             return {}
@@ -368,12 +407,10 @@ class OOTInstallerMiddleware:
 
     def _save_registry(self) -> None:
         """Persist the OOT image registry to disk."""
-        self._registry_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            k: v.model_dump()
-            for k, v in self._registry.items()
-        }
-        self._registry_path.write_text(json.dumps(data, indent=2))
+        _write_atomic(
+            self._registry_path,
+            _REGISTRY_ADAPTER.dump_json(self._registry, indent=2),
+        )
 
     # ──────────────────────────────────────────
     # Combo Image (Multi-OOT) Support
@@ -406,8 +443,10 @@ class OOTInstallerMiddleware:
                 )
             stage_alias = f"stage_{name}"
             stages.append(f"FROM {info.image_tag} AS {stage_alias}")
-            for path in ["/usr/lib/", "/usr/include/", "/usr/share/gnuradio/"]:
-                copies.append(f"COPY --from={stage_alias} {path} {path}")
+            copies.extend(
+                f"COPY --from={stage_alias} {path} {path}"
+                for path in COMBO_COPY_PATHS
+            )
 
         return "\n".join([
             *stages,
@@ -445,10 +484,11 @@ class OOTInstallerMiddleware:
         image_tag = self._combo_image_tag(names)
 
         try:
-            # Idempotent: skip if combo already exists
-            if not force and self._image_exists(image_tag):
+            # Idempotent: skip if combo already exists. Check the registry
+            # first so a miss never costs a Docker API round trip.
+            if not force:
                 existing = self._combo_registry.get(combo_key)
-                if existing is not None:
+                if existing is not None and self._image_exists(image_tag):
                     return ComboImageResult(
                         success=True,
                         image=existing,
@@ -543,20 +583,22 @@ class OOTInstallerMiddleware:
 
     def _load_combo_registry(self) -> dict[str, ComboImageInfo]:
         """Load the combo image registry from disk."""
-        if not self._combo_registry_path.exists():
-            return {}
         try:
-            data = json.loads(self._combo_registry_path.read_text())
-            return {k: ComboImageInfo(**v) for k, v in data.items()}
+            return _COMBO_REGISTRY_ADAPTER.validate_json(
+                self._combo_registry_path.read_bytes()
+            )
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             logger.warning("Failed to load combo registry: %s", e)
             return {}
 
     def _save_combo_registry(self) -> None:
         """Persist the combo image registry to disk."""
-        self._combo_registry_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {k: v.model_dump() for k, v in self._combo_registry.items()}
-        self._combo_registry_path.write_text(json.dumps(data, indent=2))
+        _write_atomic(
+            self._combo_registry_path,
+            _COMBO_REGISTRY_ADAPTER.dump_json(self._combo_registry, indent=2),
+        )
 
     # ──────────────────────────────────────────
     # OOT Module Detection
@@ -705,16 +747,14 @@ class OOTInstallerMiddleware:
                 continue
 
             # Phase 2: Match against catalog module names as prefixes
-            matched = False
-            for module_name in CATALOG:
-                # Check for prefix match (e.g., "lora_sdr_gray_demap" -> "lora_sdr")
-                # Also handle cases like "osmosdr_source" -> "osmosdr"
-                if block_id.startswith(f"{module_name}_") or block_id == module_name:
-                    modules.add(module_name)
-                    matched = True
-                    break
-
-            if not matched and "_" in block_id:
+            # (e.g., "lora_sdr_gray_demap" -> "lora_sdr")
+            # Also handle cases like "osmosdr_source" -> "osmosdr"
+            module = self._catalog_module_for_block(block_id, CATALOG)
+            if module is not None:
+                modules.add(module)
+                continue
+
+            if "_" in block_id:
                 # Looks like an OOT block but not in catalog
                 # Don't flag all unknown blocks, just those with OOT-like patterns
                 prefix = block_id.split("_")[0]
@@ -731,6 +771,23 @@ class OOTInstallerMiddleware:
             recommended_image=self._recommend_image(sorted_modules),
         )
 
+    @staticmethod
+    def _catalog_module_for_block(
+        block_id: str, catalog: Mapping[str, Any]
+    ) -> str | None:
+        """Find the catalog module whose name is ``block_id`` or its prefix.
+
+        Walks the ``_``-delimited prefixes of the block ID from longest to
+        shortest, so each block costs a few dict lookups rather than a
+        scan of the whole catalog.
+        """
+        candidate = block_id
+        while candidate not in catalog:
+            candidate, sep, _ = candidate.rpartition("_")
+            if not sep:
+                return None
+        return candidate
+
     def _recommend_image(self, modules: list[str]) -> str | None:
         """Recommend Docker image for detected modules.
 
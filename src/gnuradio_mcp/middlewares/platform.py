@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypedDict
 
 from gnuradio.grc.core.platform import Platform
 
@@ -11,11 +11,22 @@ from gnuradio_mcp.middlewares.flowgraph import FlowGraphMiddleware
 from gnuradio_mcp.models import BlockPathsModel, BlockTypeDetailModel, BlockTypeModel
 
 
+class LoadOOTResult(TypedDict):
+    """Result of PlatformMiddleware.load_oot_paths()."""
+
+    added_paths: list[str]
+    invalid_paths: list[str]
+    blocks_before: int
+    blocks_after: int
+
+
 class PlatformMiddleware(ElementMiddleware):
     def __init__(self, platform: Platform):
         super().__init__(platform)
         self._platform = self._element
         self._oot_paths: list[str] = []
+        # Unfiltered search_blocks() result; reset whenever the library is rebuilt
+        self._all_block_details: tuple[BlockTypeDetailModel, ...] | None = None
 
     @property
     def blocks(self) -> list[BlockTypeModel]:
@@ -24,6 +35,11 @@ class PlatformMiddleware(ElementMiddleware):
             for block in self._platform.blocks.values()
         ]
 
+    @property
+    def blocks_count(self) -> int:
+        """Number of block types in the library, without building models."""
+        return len(self._platform.blocks)
+
     @property
     def default_block_paths(self) -> list[str]:
         """Get the default block paths from Platform.Config."""
@@ -34,7 +50,7 @@ class PlatformMiddleware(ElementMiddleware):
         """Get the currently loaded OOT paths."""
         return self._oot_paths.copy()
 
-    def load_oot_paths(self, paths: list[str]) -> dict:
+    def load_oot_paths(self, paths: list[str]) -> LoadOOTResult:
         """Load OOT (Out-of-Tree) block paths into the platform.
 
         Since Platform.build_library() does a full reset (clears all blocks),
@@ -50,12 +66,12 @@ class PlatformMiddleware(ElementMiddleware):
                 - blocks_before: Block count before reload
                 - blocks_after: Block count after reload
         """
-        blocks_before = len(self._platform.blocks)
+        blocks_before = self.blocks_count
 
-        # Validate paths exist
+        # Validate paths exist (each distinct path is checked once)
         valid_paths = []
         invalid_paths = []
-        for path in paths:
+        for path in dict.fromkeys(paths):
             expanded = os.path.expanduser(path)
             if Path(expanded).is_dir():
                 valid_paths.append(expanded)
@@ -75,11 +91,12 @@ class PlatformMiddleware(ElementMiddleware):
 
         # Rebuild the library with all paths
         self._platform.build_library(path=combined_paths)
+        self._all_block_details = None
 
         # Track the OOT paths we've loaded
         self._oot_paths = valid_paths
 
-        blocks_after = len(self._platform.blocks)
+        blocks_after = self.blocks_count
 
         return {
             "added_paths": valid_paths,
@@ -92,7 +109,8 @@ class PlatformMiddleware(ElementMiddleware):
         """Rebuild block library with default + OOT paths. Returns block count."""
         all_paths = self.default_block_paths + self._oot_paths
         self._platform.build_library(path=all_paths)
-        return len(self._platform.blocks)
+        self._all_block_details = None
+        return self.blocks_count
 
     def add_block_path(self, path: str) -> BlockPathsModel:
         """Add a directory of block YAMLs and rebuild the library."""
@@ -102,7 +120,7 @@ class PlatformMiddleware(ElementMiddleware):
         if path in self._oot_paths:
             return self.get_block_paths()
 
-        before = len(self._platform.blocks)
+        before = self.blocks_count
         self._oot_paths.append(path)
         total = self._rebuild_library()
         return BlockPathsModel(
@@ -115,7 +133,7 @@ class PlatformMiddleware(ElementMiddleware):
         """Return current OOT paths and block count."""
         return BlockPathsModel(
             paths=self._oot_paths.copy(),
-            block_count=len(self._platform.blocks),
+            block_count=self.blocks_count,
         )
 
     def make_flowgraph(self, filepath: str = "") -> FlowGraphMiddleware:
@@ -149,6 +167,16 @@ class PlatformMiddleware(ElementMiddleware):
                       Matches if any element in the block's category path
                       contains the string.
         """
+        if not query and not category:
+            if self._all_block_details is None:
+                self._all_block_details = tuple(
+                    BlockTypeDetailModel.from_block_type(block_type)
+                    for block_type in self._platform.blocks.values()
+                )
+            # Deep copies: the models (and their lists) are mutable, and
+            # callers must not be able to alter the cached entries
+            return [m.model_copy(deep=True) for m in self._all_block_details]
+
         results = []
         query_lower = query.lower()
         category_lower = category.lower() if category else None
@@ -7,6 +7,7 @@ compiled .py can use a different XML-RPC port than what GRC baked in.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
@@ -77,9 +78,9 @@ def find_free_port() -> int:
     """Find a free TCP port using the OS ephemeral range.
 
     Binds to port 0, which lets the kernel pick an available port,
-    then closes the socket and returns the chosen port. A second
-    availability check guards against the (rare) race where another
-    process grabs it between close and Docker bind.
+    then closes the socket and returns the chosen port: one bind, no
+    probing loop. Another process can still grab the port between close
+    and Docker bind; the launch then fails with Docker's bind error.
     """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
         sock.bind(("", 0))
@@ -122,9 +123,9 @@ def patch_xmlrpc_port(flowgraph_py: Path, new_port: int) -> Path:
         dir=flowgraph_py.parent,
     )
     tmp = Path(tmp_path)
-    tmp.write_text(patched)
-    # mkstemp opens the fd; we wrote via Path so close it
-    os.close(fd)
+    # Write through the fd mkstemp already opened instead of reopening
+    with os.fdopen(fd, "w") as f:
+        f.write(patched)
 
     logger.debug("Patched flowgraph written to %s", tmp)
     return tmp
@@ -151,7 +152,9 @@ def patch_flowgraph(
     """Apply all patches (port rewrite + compat fixes) in a single pass.
 
     Returns the original path unchanged if no patches were needed,
-    or a new temp file in the same directory.
+    otherwise a ``<stem>.<hash>.patched.py`` file in the same directory.
+    The name is derived from the patched content, so an existing copy
+    with the expected content is reused rather than rewritten.
     """
     text = flowgraph_py.read_text()
     original = text
@@ -164,13 +167,31 @@ def patch_flowgraph(
     if text == original:
         return flowgraph_py
 
+    # Name the copy after its content so repeated launches of the same
+    # flowgraph (and port) reuse one file instead of writing a new one.
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    patched = flowgraph_py.with_name(f"{flowgraph_py.stem}.{digest}.patched.py")
+    data = text.encode()
+    try:
+        # Only trust the name if the content matches; a partial file
+        # left by an interrupted write must not be reused
+        if patched.read_bytes() == data:
+            logger.debug("Reusing patched flowgraph %s", patched)
+            return patched
+    except FileNotFoundError:
+        pass
+
+    # Write a unique temp file and rename it into place, so concurrent
+    # launches never observe (or leave behind) a half-written copy
     fd, tmp_path = tempfile.mkstemp(
-        suffix=".py",
-        prefix=f"{flowgraph_py.stem}_patched_",
-        dir=flowgraph_py.parent,
+        suffix=".tmp", prefix=f".{patched.name}.", dir=patched.parent
     )
-    tmp = Path(tmp_path)
-    tmp.write_text(text)
-    os.close(fd)
-    logger.debug("Patched flowgraph written to %s", tmp)
-    return tmp
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, patched)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    logger.debug("Patched flowgraph written to %s", patched)
+    return patched
@@ -18,8 +18,9 @@ logger = logging.getLogger(__name__)
 THRIFT_TIMEOUT = 5
 DEFAULT_THRIFT_PORT = 9090
 
-# Performance counter knob suffixes (used to identify perf counters)
-PERF_COUNTER_SUFFIXES = [
+# Performance counter knob suffixes (used to identify perf counters).
+# A tuple so str.endswith() can match all of them in one call.
+PERF_COUNTER_SUFFIXES = (
     "::avg throughput",
     "::avg work time",
     "::total work time",
@@ -28,7 +29,7 @@ PERF_COUNTER_SUFFIXES = [
     "::avg output % full",
     "::var nproduced",
     "::var work time",
-]
+)
 
 
 class ThriftMiddleware:
@@ -334,7 +335,7 @@ class ThriftMiddleware:
     @staticmethod
     def _is_perf_counter(name: str) -> bool:
         """Check if a knob name is a performance counter."""
-        return any(name.endswith(suffix) for suffix in PERF_COUNTER_SUFFIXES)
+        return name.endswith(PERF_COUNTER_SUFFIXES)
 
     @staticmethod
     def _to_list(value: Any) -> list[float]:
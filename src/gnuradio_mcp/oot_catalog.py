@@ -11,7 +11,11 @@ from source (e.g., to get a newer version) via install_oot_module().
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from pydantic import BaseModel, ConfigDict
 
 
 # ──────────────────────────────────────────────
@@ -22,6 +26,8 @@ from pydantic import BaseModel
 class OOTModuleEntry(BaseModel):
     """A curated OOT module in the directory."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     category: str
@@ -37,6 +43,8 @@ class OOTModuleEntry(BaseModel):
 class OOTModuleSummary(BaseModel):
     """Compact entry for the directory index."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     category: str
@@ -47,6 +55,8 @@ class OOTModuleSummary(BaseModel):
 class OOTDirectoryIndex(BaseModel):
     """Response shape for oot://directory."""
 
+    model_config = ConfigDict(frozen=True)
+
     modules: list[OOTModuleSummary]
     count: int
 
@@ -54,6 +64,8 @@ class OOTDirectoryIndex(BaseModel):
 class OOTModuleDetail(BaseModel):
     """Response shape for oot://directory/{name}."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     category: str
@@ -100,7 +112,7 @@ def _entry(
     )
 
 
-CATALOG: dict[str, OOTModuleEntry] = {
+_CATALOG: dict[str, OOTModuleEntry] = {
     e.name: e
     for e in [
         # ── Pre-installed in gnuradio-runtime base image ──
@@ -324,9 +336,25 @@ CATALOG: dict[str, OOTModuleEntry] = {
     ]
 }
 
+# Read-only view; the catalog is fixed at import time
+CATALOG: Mapping[str, OOTModuleEntry] = MappingProxyType(_CATALOG)
+
 
 def build_install_example(entry: OOTModuleEntry) -> str:
     """Format a copy-paste install_oot_module() call for this module."""
+    # Catalog entries never change, so their examples are built once.
+    # Ad-hoc entries (even ones sharing a catalog name) are formatted fresh.
+    if CATALOG.get(entry.name) is entry:
+        return _catalog_install_example(entry.name)
+    return _format_install_example(entry)
+
+
+@functools.lru_cache(maxsize=None)
+def _catalog_install_example(name: str) -> str:
+    return _format_install_example(CATALOG[name])
+
+
+def _format_install_example(entry: OOTModuleEntry) -> str:
     parts = [f'install_oot_module(git_url="{entry.git_url}"']
     if entry.branch != "main":
         parts.append(f', branch="{entry.branch}"')
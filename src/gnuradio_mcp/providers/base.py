@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from gnuradio_mcp.middlewares.platform import PlatformMiddleware
+from gnuradio_mcp.middlewares.platform import LoadOOTResult, PlatformMiddleware
 from gnuradio_mcp.models import (
     SINK,
     SOURCE,
@@ -106,7 +106,7 @@ class PlatformProvider:
         self._platform_mw.save_flowgraph(filepath, self._flowgraph_mw)
         return True
 
-    def load_oot_blocks(self, paths: List[str]) -> Dict[str, Any]:
+    def load_oot_blocks(self, paths: List[str]) -> LoadOOTResult:
         """Load OOT (Out-of-Tree) block paths into the platform.
 
         OOT modules are third-party GNU Radio blocks installed separately.
@@ -117,6 +117,8 @@ class PlatformProvider:
 
         Since Platform.build_library() does a full reset, this method
         combines the default block paths with the OOT paths and rebuilds.
+        Pass every OOT path in a single call: each call rescans the whole
+        library once, and its paths replace those from any earlier call.
 
         Args:
             paths: List of directory paths containing .block.yml files
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import shutil
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Literal
 
@@ -32,6 +34,11 @@ from gnuradio_mcp.models import (
 
 logger = logging.getLogger(__name__)
 
+# TOTAL row of `coverage report`: Stmts, Miss, Branch, BrPart, Cover%
+_COVERAGE_TOTAL_RE = re.compile(
+    r"^TOTAL\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)%", re.MULTILINE
+)
+
 
 class RuntimeProvider:
     """Business logic for runtime flowgraph control.
@@ -47,10 +54,15 @@ class RuntimeProvider:
         self,
         docker_mw: DockerMiddleware | None = None,
         oot_mw: OOTInstallerMiddleware | None = None,
+        xmlrpc_factory: Callable[[str], XmlRpcMiddleware] = XmlRpcMiddleware.connect,
     ):
         self._docker = docker_mw
         self._oot = oot_mw
+        # Opens an XML-RPC connection for a URL; injectable for tests
+        self._xmlrpc_factory = xmlrpc_factory
         self._xmlrpc: XmlRpcMiddleware | None = None
+        # Fetched at connect time; method lists don't change while connected
+        self._connection_info: ConnectionInfoModel | None = None
         self._thrift: ThriftMiddleware | None = None
         self._active_container: str | None = None
 
@@ -216,29 +228,38 @@ class RuntimeProvider:
 
     def connect(self, url: str) -> ConnectionInfoModel:
         """Connect to a GNU Radio XML-RPC endpoint."""
-        self._xmlrpc = XmlRpcMiddleware.connect(url)
+        self._xmlrpc = self._xmlrpc_factory(url)
+        # Drop the previous endpoint's info before fetching; if the fetch
+        # fails, get_status() refetches rather than reporting stale data
+        self._connection_info = None
         self._active_container = None
         # Parse port from URL
         from urllib.parse import urlparse
 
         parsed = urlparse(url)
         port = parsed.port or 8080
-        return self._xmlrpc.get_connection_info(xmlrpc_port=port)
+        self._connection_info = self._xmlrpc.get_connection_info(xmlrpc_port=port)
+        return self._connection_info
 
     def connect_to_container(self, name: str) -> ConnectionInfoModel:
         """Connect to a flowgraph by container name (resolves port automatically)."""
         docker = self._require_docker()
         port = docker.get_xmlrpc_port(name)
         url = f"http://localhost:{port}"
-        self._xmlrpc = XmlRpcMiddleware.connect(url)
+        self._xmlrpc = self._xmlrpc_factory(url)
+        self._connection_info = None
         self._active_container = name
-        return self._xmlrpc.get_connection_info(container_name=name, xmlrpc_port=port)
+        self._connection_info = self._xmlrpc.get_connection_info(
+            container_name=name, xmlrpc_port=port
+        )
+        return self._connection_info
 
     def disconnect(self) -> bool:
         """Disconnect from the current XML-RPC endpoint."""
         if self._xmlrpc is not None:
             self._xmlrpc.close()
             self._xmlrpc = None
+        self._connection_info = None
         if self._thrift is not None:
             self._thrift.close()
             self._thrift = None
@@ -387,13 +408,20 @@ class RuntimeProvider:
         """Get runtime status including connection and container info."""
         connection = None
         if self._xmlrpc is not None:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(self._xmlrpc._url)
-            port = parsed.port or 8080
-            connection = self._xmlrpc.get_connection_info(
-                container_name=self._active_container, xmlrpc_port=port
-            )
+            connection = self._connection_info
+            if connection is None:
+                from urllib.parse import urlparse
+
+                parsed = urlparse(self._xmlrpc._url)
+                port = parsed.port or 8080
+                connection = self._xmlrpc.get_connection_info(
+                    container_name=self._active_container, xmlrpc_port=port
+                )
+                self._connection_info = connection
+            elif connection.container_name != self._active_container:
+                connection = connection.model_copy(
+                    update={"container_name": self._active_container}
+                )
 
         containers = []
         if self._has_docker:
@@ -501,11 +529,7 @@ class RuntimeProvider:
             "coverage_percent": None,
         }
         # Look for TOTAL line
-        match = re.search(
-            r"^TOTAL\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)%",
-            output,
-            re.MULTILINE,
-        )
+        match = _COVERAGE_TOTAL_RE.search(output)
         if match:
             total_stmts = int(match.group(1))
             miss_stmts = int(match.group(2))
@@ -720,19 +744,20 @@ class RuntimeProvider:
             if coverage_dir.exists():
                 shutil.rmtree(coverage_dir)
                 deleted += 1
-        elif older_than_days is not None:
-            # Delete coverage older than N days
-            cutoff = time.time() - (older_than_days * 86400)
-            for coverage_dir in coverage_base.iterdir():
-                if coverage_dir.is_dir():
-                    if coverage_dir.stat().st_mtime < cutoff:
-                        shutil.rmtree(coverage_dir)
-                        deleted += 1
         else:
-            # No filter - delete all
-            for coverage_dir in coverage_base.iterdir():
-                if coverage_dir.is_dir():
-                    shutil.rmtree(coverage_dir)
+            # Delete coverage older than N days, or all of it with no filter.
+            # scandir entries carry the file type, so only the age check
+            # needs a stat() per directory.
+            cutoff = None
+            if older_than_days is not None:
+                cutoff = time.time() - (older_than_days * 86400)
+            with os.scandir(coverage_base) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    if cutoff is not None and entry.stat().st_mtime >= cutoff:
+                        continue
+                    shutil.rmtree(entry.path)
                     deleted += 1
 
         return deleted
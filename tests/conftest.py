@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+
 import pytest
 from gnuradio import gr
 from gnuradio.grc.core.platform import Platform
@@ -7,7 +10,7 @@ from gnuradio.grc.core.platform import Platform
 from gnuradio_mcp.middlewares.platform import PlatformMiddleware
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def platform() -> Platform:
     platform = Platform(
         version=gr.version(),
@@ -22,11 +25,29 @@ def platform() -> Platform:
     return platform
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def platform_middleware(platform: Platform) -> PlatformMiddleware:
     return PlatformMiddleware(platform)
 
 
+@pytest.fixture
+def oot_reset(platform_middleware: PlatformMiddleware):
+    """Restore the shared middleware's OOT paths after a test changes them."""
+    saved = platform_middleware.oot_paths
+    yield platform_middleware
+    if platform_middleware.oot_paths != saved:
+        platform_middleware._oot_paths = saved
+        platform_middleware._rebuild_library()
+
+
+@pytest.fixture(scope="session")
+def empty_oot_dir(tmp_path_factory) -> Iterator[str]:
+    """An existing, empty directory shared by tests that only load it."""
+    path = str(tmp_path_factory.mktemp("empty_oot"))
+    yield path
+    assert not os.listdir(path), "empty_oot_dir must not be written to"
+
+
 @pytest.fixture(params=[1, 2, 10])  # Arbitrary number of blocks to test
 def block_key(platform, request):
     block_keys = list(platform.blocks.keys())
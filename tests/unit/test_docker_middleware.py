@@ -1,6 +1,8 @@
 """Unit tests for DockerMiddleware with mocked Docker client."""
 
-import socket
+import logging
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -150,15 +152,16 @@ class TestLaunch:
 
 class TestListContainers:
     def test_list_containers(self, docker_mw, mock_docker_client):
-        mock_c = MagicMock()
-        mock_c.name = "gr-test"
-        mock_c.id = "abc123def456"
-        mock_c.status = "running"
-        mock_c.labels = {
-            "gr-mcp.flowgraph": "/path/to/test.grc",
-            "gr-mcp.xmlrpc-port": "8080",
-            "gr-mcp.vnc-enabled": "0",
-        }
+        mock_c = SimpleNamespace(
+            name="gr-test",
+            id="abc123def456",
+            status="running",
+            labels={
+                "gr-mcp.flowgraph": "/path/to/test.grc",
+                "gr-mcp.xmlrpc-port": "8080",
+                "gr-mcp.vnc-enabled": "0",
+            },
+        )
         mock_docker_client.containers.list.return_value = [mock_c]
 
         result = docker_mw.list_containers()
@@ -168,21 +171,38 @@ class TestListContainers:
         assert result[0].vnc_port is None  # VNC not enabled
 
     def test_list_containers_with_vnc(self, docker_mw, mock_docker_client):
-        mock_c = MagicMock()
-        mock_c.name = "gr-test-vnc"
-        mock_c.id = "abc123def456"
-        mock_c.status = "running"
-        mock_c.labels = {
-            "gr-mcp.flowgraph": "/path/to/test.grc",
-            "gr-mcp.xmlrpc-port": "8080",
-            "gr-mcp.vnc-enabled": "1",
-        }
+        mock_c = SimpleNamespace(
+            name="gr-test-vnc",
+            id="abc123def456",
+            status="running",
+            labels={
+                "gr-mcp.flowgraph": "/path/to/test.grc",
+                "gr-mcp.xmlrpc-port": "8080",
+                "gr-mcp.vnc-enabled": "1",
+            },
+        )
         mock_docker_client.containers.list.return_value = [mock_c]
 
         result = docker_mw.list_containers()
         assert len(result) == 1
         assert result[0].vnc_port == 5900  # VNC enabled
 
+    def test_list_containers_single_api_call(self, docker_mw, mock_docker_client):
+        """Listing reads labels from the list payload, no per-container lookups."""
+        # A plain namespace has no reload(); any per-item refresh would raise.
+        mock_c = SimpleNamespace(
+            name="gr-test",
+            id="abc123def456",
+            status="running",
+            labels={"gr-mcp.xmlrpc-port": "8080"},
+        )
+        mock_docker_client.containers.list.return_value = [mock_c, mock_c]
+
+        docker_mw.list_containers()
+
+        mock_docker_client.containers.list.assert_called_once()
+        mock_docker_client.containers.get.assert_not_called()
+
     def test_list_containers_empty(self, docker_mw, mock_docker_client):
         mock_docker_client.containers.list.return_value = []
         result = docker_mw.list_containers()
@@ -336,27 +356,29 @@ class TestCoverage:
     def test_list_containers_includes_coverage_enabled(
         self, docker_mw, mock_docker_client
     ):
-        mock_container_cov = MagicMock()
-        mock_container_cov.name = "with-cov"
-        mock_container_cov.id = "aaa111"
-        mock_container_cov.status = "running"
-        mock_container_cov.labels = {
-            "gr-mcp.flowgraph": "/test.grc",
-            "gr-mcp.xmlrpc-port": "8080",
-            "gr-mcp.vnc-enabled": "0",
-            "gr-mcp.coverage-enabled": "1",
-        }
-
-        mock_container_no_cov = MagicMock()
-        mock_container_no_cov.name = "no-cov"
-        mock_container_no_cov.id = "bbb222"
-        mock_container_no_cov.status = "running"
-        mock_container_no_cov.labels = {
-            "gr-mcp.flowgraph": "/test2.grc",
-            "gr-mcp.xmlrpc-port": "8081",
-            "gr-mcp.vnc-enabled": "0",
-            "gr-mcp.coverage-enabled": "0",
-        }
+        mock_container_cov = SimpleNamespace(
+            name="with-cov",
+            id="aaa111",
+            status="running",
+            labels={
+                "gr-mcp.flowgraph": "/test.grc",
+                "gr-mcp.xmlrpc-port": "8080",
+                "gr-mcp.vnc-enabled": "0",
+                "gr-mcp.coverage-enabled": "1",
+            },
+        )
+
+        mock_container_no_cov = SimpleNamespace(
+            name="no-cov",
+            id="bbb222",
+            status="running",
+            labels={
+                "gr-mcp.flowgraph": "/test2.grc",
+                "gr-mcp.xmlrpc-port": "8081",
+                "gr-mcp.vnc-enabled": "0",
+                "gr-mcp.coverage-enabled": "0",
+            },
+        )
 
         mock_docker_client.containers.list.return_value = [
             mock_container_cov,
@@ -368,22 +390,22 @@ class TestCoverage:
         assert result[0].coverage_enabled is True
         assert result[1].coverage_enabled is False
 
-    def test_is_coverage_enabled(self, docker_mw, mock_docker_client):
+    @pytest.mark.parametrize(
+        "labels,expected",
+        [
+            ({"gr-mcp.coverage-enabled": "1"}, True),
+            ({"gr-mcp.coverage-enabled": "0"}, False),
+            ({}, False),
+        ],
+    )
+    def test_is_coverage_enabled(self, docker_mw, mock_docker_client, labels, expected):
         mock_container = MagicMock()
-        mock_container.labels = {"gr-mcp.coverage-enabled": "1"}
+        mock_container.labels = labels
         mock_docker_client.containers.get.return_value = mock_container
 
-        assert docker_mw.is_coverage_enabled("test") is True
-
-        mock_container.labels = {"gr-mcp.coverage-enabled": "0"}
-        assert docker_mw.is_coverage_enabled("test") is False
-
-        mock_container.labels = {}
-        assert docker_mw.is_coverage_enabled("test") is False
+        assert docker_mw.is_coverage_enabled("test") is expected
 
     def test_get_coverage_dir(self, docker_mw):
-        from pathlib import Path
-
         from gnuradio_mcp.middlewares.docker import HOST_COVERAGE_BASE
 
         result = docker_mw.get_coverage_dir("my-container")
@@ -391,8 +413,6 @@ class TestCoverage:
         assert result == expected
 
     def test_stop_with_timeout_warning(self, docker_mw, mock_docker_client, caplog):
-        import logging
-
         mock_container = MagicMock()
         mock_container.stop.side_effect = Exception("Timeout waiting for container")
         mock_docker_client.containers.get.return_value = mock_container
@@ -425,30 +445,29 @@ class TestPortAllocation:
         mock_container.id = "abc123def456"
         mock_docker_client.containers.run.return_value = mock_container
 
-        result = docker_mw.launch(
-            flowgraph_path=str(fg_file),
-            name="test-auto",
-            xmlrpc_port=0,
-        )
-        # Auto-allocated port should be > 0 and not the default
-        assert result.xmlrpc_port > 0
+        with patch(
+            "gnuradio_mcp.middlewares.docker.find_free_port", return_value=54321
+        ):
+            result = docker_mw.launch(
+                flowgraph_path=str(fg_file),
+                name="test-auto",
+                xmlrpc_port=0,
+            )
+        assert result.xmlrpc_port == 54321
 
     def test_launch_occupied_port_raises(self, docker_mw, mock_docker_client, tmp_path):
         """Requesting a port that's already in use should raise PortConflictError."""
         fg_file = tmp_path / "test.py"
         fg_file.write_text(_SAMPLE_FG)
 
-        # Hold a port open
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            s.bind(("127.0.0.1", 0))
-            occupied_port = s.getsockname()[1]
-
+        with patch(
+            "gnuradio_mcp.middlewares.docker.is_port_available", return_value=False
+        ):
             with pytest.raises(PortConflictError, match="already in use"):
                 docker_mw.launch(
                     flowgraph_path=str(fg_file),
                     name="test-conflict",
-                    xmlrpc_port=occupied_port,
+                    xmlrpc_port=12345,
                 )
 
     def test_launch_patches_mismatched_port(
@@ -462,9 +481,18 @@ class TestPortAllocation:
         mock_container.id = "abc123def456"
         mock_docker_client.containers.run.return_value = mock_container
 
-        # Use a port we know is free (mock is_port_available for determinism)
-        with patch(
-            "gnuradio_mcp.middlewares.docker.is_port_available", return_value=True
+        # Use a port we know is free (mock is_port_available for determinism).
+        # The rewrite itself is covered in test_ports; only check the call here.
+        patched_file = tmp_path / "flowgraph.patched.py"
+        with (
+            patch(
+                "gnuradio_mcp.middlewares.docker.is_port_available",
+                return_value=True,
+            ),
+            patch(
+                "gnuradio_mcp.middlewares.docker.patch_flowgraph",
+                return_value=patched_file,
+            ) as patcher,
         ):
             result = docker_mw.launch(
                 flowgraph_path=str(fg_file),
@@ -473,9 +501,8 @@ class TestPortAllocation:
             )
 
         assert result.xmlrpc_port == 9999
-
-        # Original file should be unchanged
-        assert "8080" in fg_file.read_text()
+        patcher.assert_called_once_with(fg_file.resolve(), xmlrpc_port=9999)
+        assert result.flowgraph_path == str(patched_file)
 
     def test_launch_compat_patch_when_ports_match(
         self, docker_mw, mock_docker_client, tmp_path
@@ -499,11 +526,11 @@ class TestPortAllocation:
 
         assert result.xmlrpc_port == 8080
         # Compat patches (localhost→0.0.0.0) create a patched file even
-        # when the port matches, so we expect 2 .py files.
+        # when the port matches.
         py_files = list(tmp_path.glob("*.py"))
-        assert len(py_files) == 2
         patched = [f for f in py_files if "patched" in f.name]
         assert len(patched) == 1
+        assert result.flowgraph_path == str(patched[0])
         # Port unchanged, but localhost rewritten to 0.0.0.0
         patched_text = patched[0].read_text()
         assert "8080" in patched_text
@@ -5,6 +5,8 @@ close the gap between gr-mcp and grcc/GRC.
 """
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from gnuradio_mcp.middlewares.flowgraph import FlowGraphMiddleware
@@ -23,6 +25,12 @@ def flowgraph_middleware(platform_middleware: PlatformMiddleware):
     return platform_middleware.make_flowgraph()
 
 
+@pytest.fixture(scope="module")
+def generated_code(platform_middleware: PlatformMiddleware) -> GeneratedCodeModel:
+    """Run the code generator once for the read-only generate_code tests."""
+    return platform_middleware.make_flowgraph().generate_code()
+
+
 # ──────────────────────────────────────────────
 # Gap 3: Flowgraph Options
 # ──────────────────────────────────────────────
@@ -110,8 +118,46 @@ def test_search_blocks_by_category(platform_middleware: PlatformMiddleware):
 def test_search_blocks_empty_query(platform_middleware: PlatformMiddleware):
     # Empty query should return all blocks
     all_results = platform_middleware.search_blocks()
-    all_blocks = platform_middleware.blocks
-    assert len(all_results) == len(all_blocks)
+    assert len(all_results) == platform_middleware.blocks_count
+
+
+def test_search_blocks_empty_query_reuses_models(
+    platform_middleware: PlatformMiddleware,
+):
+    first = platform_middleware.search_blocks()
+    second = platform_middleware.search_blocks()
+    # Equal results each call, but callers get their own copies
+    assert first == second
+    assert all(a is not b for a, b in zip(first, second))
+
+    first[0].category.append("Mutated")
+    assert "Mutated" not in platform_middleware.search_blocks()[0].category
+
+
+DUMMY_BLOCK_YML = """\
+id: gr_mcp_test_dummy
+label: gr-mcp Test Dummy
+category: '[gr-mcp Tests]'
+templates:
+  imports: ''
+  make: ''
+file_format: 1
+"""
+
+
+@pytest.mark.usefixtures("oot_reset")
+def test_search_blocks_cache_cleared_on_path_load(
+    platform_middleware: PlatformMiddleware, tmp_path
+):
+    platform_middleware.search_blocks()  # Prime the cache
+    (tmp_path / "gr_mcp_test_dummy.block.yml").write_text(DUMMY_BLOCK_YML)
+
+    result = platform_middleware.add_block_path(str(tmp_path))
+
+    blocks = platform_middleware.search_blocks()
+    assert result.blocks_added == 1
+    assert len(blocks) == platform_middleware.blocks_count
+    assert any(b.key == "gr_mcp_test_dummy" for b in blocks)
 
 
 def test_search_blocks_no_match(platform_middleware: PlatformMiddleware):
@@ -208,8 +254,8 @@ def test_roundtrip_export_import(
 # ──────────────────────────────────────────────
 
 
-def test_generate_code_produces_output(flowgraph_middleware: FlowGraphMiddleware):
-    result = flowgraph_middleware.generate_code()
+def test_generate_code_produces_output(generated_code: GeneratedCodeModel):
+    result = generated_code
     assert isinstance(result, GeneratedCodeModel)
     assert len(result.files) > 0
     assert result.flowgraph_id
@@ -220,45 +266,42 @@ def test_generate_code_produces_output(flowgraph_middleware: FlowGraphMiddleware
     assert len(main_files) >= 1
 
 
-def test_generate_code_contains_python(flowgraph_middleware: FlowGraphMiddleware):
-    result = flowgraph_middleware.generate_code()
+def test_generate_code_contains_python(generated_code: GeneratedCodeModel):
+    result = generated_code
     main = next((f for f in result.files if f.is_main), None)
     assert main is not None
     # Generated Python code should contain typical markers
     assert "import" in main.content or "#include" in main.content
 
 
-def test_generate_code_with_output_dir(flowgraph_middleware: FlowGraphMiddleware):
+def test_generate_code_with_output_dir(
+    flowgraph_middleware: FlowGraphMiddleware, tmp_path
+):
     """Files persist on disk when output_dir is specified."""
-    import os
-    import tempfile
-
-    output_dir = tempfile.mkdtemp(prefix="gr_mcp_test_")
+    output_dir = str(tmp_path)
     result = flowgraph_middleware.generate_code(output_dir=output_dir)
 
     assert result.output_dir == output_dir
     # Files should exist on disk
     main = next((f for f in result.files if f.is_main), None)
     assert main is not None
-    assert os.path.exists(os.path.join(output_dir, main.filename))
+    assert (tmp_path / main.filename).exists()
 
 
 def test_generate_code_returns_validation_state(
-    flowgraph_middleware: FlowGraphMiddleware,
+    generated_code: GeneratedCodeModel,
 ):
     """generate_code includes is_valid and warnings in response."""
-    result = flowgraph_middleware.generate_code()
+    result = generated_code
     assert isinstance(result.is_valid, bool)
     assert isinstance(result.warnings, list)
 
 
 def test_generate_code_default_output_persists(
-    flowgraph_middleware: FlowGraphMiddleware,
+    generated_code: GeneratedCodeModel,
 ):
     """Default temp dir persists files (not cleaned up after call)."""
-    import os
-
-    result = flowgraph_middleware.generate_code()
+    result = generated_code
     assert result.output_dir  # Should have a temp path
     assert os.path.isdir(result.output_dir)  # Dir still exists
     main = next((f for f in result.files if f.is_main), None)
@@ -283,6 +326,7 @@ def test_add_block_path_nonexistent_raises(platform_middleware: PlatformMiddlewa
         platform_middleware.add_block_path("/nonexistent/path")
 
 
+@pytest.mark.usefixtures("oot_reset")
 def test_add_block_path_idempotent(platform_middleware: PlatformMiddleware, tmp_path):
     result = platform_middleware.add_block_path(str(tmp_path))
     assert str(tmp_path) in result.paths
@@ -290,6 +334,7 @@ def test_add_block_path_idempotent(platform_middleware: PlatformMiddleware, tmp_
     assert result2.paths.count(str(tmp_path)) == 1
 
 
+@pytest.mark.usefixtures("oot_reset")
 def test_add_block_path_returns_block_count(
     platform_middleware: PlatformMiddleware, tmp_path
 ):
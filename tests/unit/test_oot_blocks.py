@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-import tempfile
+from unittest.mock import patch
 
-from gnuradio.grc.core.platform import Platform
+import pytest
 
 from gnuradio_mcp.middlewares.platform import PlatformMiddleware
 from gnuradio_mcp.providers.base import PlatformProvider
 
+pytestmark = pytest.mark.usefixtures("oot_reset")
+
+# Placeholder for the empty_oot_dir fixture path in parametrized inputs
+EMPTY_DIR = object()
+
 
 class TestPlatformMiddlewareOOT:
     """Tests for OOT (Out-of-Tree) block path loading."""
 
-    def test_default_block_paths_property(self, platform: Platform):
+    def test_default_block_paths_property(
+        self, platform_middleware: PlatformMiddleware
+    ):
         """Verify we can access default block paths from Platform.Config."""
-        middleware = PlatformMiddleware(platform)
+        middleware = platform_middleware
         default_paths = middleware.default_block_paths
 
         assert isinstance(default_paths, list)
@@ -21,53 +28,102 @@ class TestPlatformMiddlewareOOT:
         # Should include the system blocks path
         assert any("gnuradio" in path for path in default_paths)
 
-    def test_oot_paths_initially_empty(self, platform: Platform):
-        """Verify OOT paths are empty on fresh middleware."""
-        middleware = PlatformMiddleware(platform)
+    def test_oot_paths_initially_empty(self, platform_middleware: PlatformMiddleware):
+        """Verify no OOT paths are loaded by default."""
+        middleware = platform_middleware
         assert middleware.oot_paths == []
 
-    def test_load_oot_paths_with_invalid_path(self, platform: Platform):
-        """Verify invalid paths are reported correctly."""
-        middleware = PlatformMiddleware(platform)
-        blocks_before = len(middleware.blocks)
-
-        result = middleware.load_oot_paths(["/nonexistent/path/to/blocks"])
+    @pytest.mark.parametrize(
+        "inputs,added,invalid",
+        [
+            pytest.param(
+                ["/nonexistent/path/to/blocks"],
+                [],
+                ["/nonexistent/path/to/blocks"],
+                id="invalid-only",
+            ),
+            pytest.param([EMPTY_DIR], [EMPTY_DIR], [], id="empty-directory"),
+            pytest.param(
+                [EMPTY_DIR, "/nonexistent/path"],
+                [EMPTY_DIR],
+                ["/nonexistent/path"],
+                id="mixed-valid-invalid",
+            ),
+        ],
+    )
+    def test_load_oot_paths_classification(
+        self,
+        platform_middleware: PlatformMiddleware,
+        empty_oot_dir: str,
+        inputs,
+        added,
+        invalid,
+    ):
+        """Verify paths are split into added and invalid lists."""
+        middleware = platform_middleware
+        blocks_before = middleware.blocks_count
 
-        assert result["added_paths"] == []
-        assert result["invalid_paths"] == ["/nonexistent/path/to/blocks"]
-        assert result["blocks_before"] == blocks_before
-        assert result["blocks_after"] == blocks_before
-        assert middleware.oot_paths == []
+        def resolve(paths: list) -> list[str]:
+            return [empty_oot_dir if p is EMPTY_DIR else p for p in paths]
 
-    def test_load_oot_paths_with_empty_directory(self, platform: Platform):
-        """Verify loading an empty directory doesn't break anything."""
-        middleware = PlatformMiddleware(platform)
-        blocks_before = len(middleware.blocks)
+        result = middleware.load_oot_paths(resolve(inputs))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = middleware.load_oot_paths([tmpdir])
+        assert result["added_paths"] == resolve(added)
+        assert result["invalid_paths"] == resolve(invalid)
+        assert result["blocks_before"] == blocks_before
+        # An empty dir adds nothing; with no valid paths nothing is rebuilt
+        assert result["blocks_after"] <= blocks_before
+        if not added:
+            assert result["blocks_after"] == blocks_before
+        assert middleware.oot_paths == resolve(added)
 
-            assert result["added_paths"] == [tmpdir]
-            assert result["invalid_paths"] == []
-            assert result["blocks_before"] == blocks_before
-            # Should have same or fewer blocks (empty dir adds nothing)
-            assert result["blocks_after"] <= blocks_before
-            assert middleware.oot_paths == [tmpdir]
+    def test_load_oot_paths_invalid_skips_rebuild(
+        self, platform_middleware: PlatformMiddleware
+    ):
+        """Verify no library rebuild happens when nothing valid was passed."""
+        with patch.object(
+            platform_middleware._platform, "build_library"
+        ) as build_library:
+            platform_middleware.load_oot_paths(["/nonexistent/path/to/blocks"])
 
-    def test_load_oot_paths_with_mixed_valid_invalid(self, platform: Platform):
-        """Verify mixed valid/invalid paths are handled correctly."""
-        middleware = PlatformMiddleware(platform)
+        build_library.assert_not_called()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = middleware.load_oot_paths([tmpdir, "/nonexistent/path"])
+    def test_load_oot_paths_batches_rescan(
+        self, platform_middleware: PlatformMiddleware, tmp_path
+    ):
+        """Verify several paths are loaded with a single library rebuild."""
+        dirs = []
+        for name in ("oot1", "oot2", "oot3"):
+            (tmp_path / name).mkdir()
+            dirs.append(str(tmp_path / name))
+
+        with patch.object(
+            platform_middleware._platform, "build_library"
+        ) as build_library:
+            result = platform_middleware.load_oot_paths(dirs)
+
+        build_library.assert_called_once()
+        passed_paths = build_library.call_args.kwargs["path"]
+        assert passed_paths[-3:] == dirs
+        assert result["added_paths"] == dirs
+
+    def test_load_oot_paths_deduplicates(
+        self, platform_middleware: PlatformMiddleware, empty_oot_dir: str
+    ):
+        """Verify repeated paths are validated and added only once."""
+        result = platform_middleware.load_oot_paths(
+            [empty_oot_dir, "/nonexistent/path", empty_oot_dir, "/nonexistent/path"]
+        )
 
-            assert result["added_paths"] == [tmpdir]
-            assert result["invalid_paths"] == ["/nonexistent/path"]
-            assert middleware.oot_paths == [tmpdir]
+        assert result["added_paths"] == [empty_oot_dir]
+        assert result["invalid_paths"] == ["/nonexistent/path"]
+        assert platform_middleware.oot_paths == [empty_oot_dir]
 
-    def test_load_oot_paths_expands_tilde(self, platform: Platform):
+    def test_load_oot_paths_expands_tilde(
+        self, platform_middleware: PlatformMiddleware
+    ):
         """Verify ~ is expanded to home directory."""
-        middleware = PlatformMiddleware(platform)
+        middleware = platform_middleware
 
         # This should either fail validation (if path doesn't exist)
         # or succeed (if it does) - either way, it shouldn't error
@@ -76,9 +132,22 @@ class TestPlatformMiddlewareOOT:
         # The path should be in invalid_paths since it doesn't exist
         assert "~/nonexistent_oot_test_dir" in result["invalid_paths"]
 
-    def test_load_oot_paths_with_system_blocks_path(self, platform: Platform):
+    def test_load_oot_paths_expands_tilde_to_home(
+        self, platform_middleware: PlatformMiddleware, tmp_path, monkeypatch
+    ):
+        """Verify a ~/ path that exists is resolved against $HOME."""
+        (tmp_path / "oot").mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        result = platform_middleware.load_oot_paths(["~/oot"])
+
+        assert result["added_paths"] == [str(tmp_path / "oot")]
+
+    def test_load_oot_paths_with_system_blocks_path(
+        self, platform_middleware: PlatformMiddleware
+    ):
         """Verify we can reload with the system blocks path (idempotent test)."""
-        middleware = PlatformMiddleware(platform)
+        middleware = platform_middleware
 
         # Get a default path and use it as "OOT" (should be no-op essentially)
         default_paths = middleware.default_block_paths
@@ -94,20 +163,16 @@ class TestPlatformMiddlewareOOT:
 class TestPlatformProviderOOT:
     """Tests for OOT block loading via PlatformProvider."""
 
-    def test_load_oot_blocks_method_exists(
-        self, platform_middleware: PlatformMiddleware
-    ):
-        """Verify the load_oot_blocks method is available on provider."""
-        provider = PlatformProvider(platform_middleware)
-        assert hasattr(provider, "load_oot_blocks")
-        assert callable(provider.load_oot_blocks)
+    @pytest.fixture(scope="class")
+    def provider(self, platform_middleware: PlatformMiddleware) -> PlatformProvider:
+        return PlatformProvider(platform_middleware)
 
-    def test_load_oot_blocks_returns_dict(
-        self, platform_middleware: PlatformMiddleware
-    ):
-        """Verify load_oot_blocks returns expected structure."""
-        provider = PlatformProvider(platform_middleware)
+    def test_load_oot_blocks_method_exists(self):
+        """Verify load_oot_blocks is defined as a method on the provider class."""
+        assert callable(getattr(PlatformProvider, "load_oot_blocks", None))
 
+    def test_load_oot_blocks_returns_dict(self, provider: PlatformProvider):
+        """Verify load_oot_blocks returns expected structure."""
         result = provider.load_oot_blocks(["/nonexistent/path"])
 
         assert isinstance(result, dict)
@@ -117,13 +182,10 @@ class TestPlatformProviderOOT:
         assert "blocks_after" in result
 
     def test_load_oot_blocks_with_valid_path(
-        self, platform_middleware: PlatformMiddleware
+        self, provider: PlatformProvider, empty_oot_dir: str
     ):
         """Verify load_oot_blocks works with a valid directory."""
-        provider = PlatformProvider(platform_middleware)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = provider.load_oot_blocks([tmpdir])
+        result = provider.load_oot_blocks([empty_oot_dir])
 
-            assert tmpdir in result["added_paths"]
-            assert result["invalid_paths"] == []
+        assert empty_oot_dir in result["added_paths"]
+        assert result["invalid_paths"] == []
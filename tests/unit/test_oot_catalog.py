@@ -1,8 +1,7 @@
 """Tests for the OOT module catalog and its data models."""
 
-import json
-
 import pytest
+from pydantic import ValidationError
 
 from gnuradio_mcp.oot_catalog import (
     CATALOG,
@@ -13,59 +12,56 @@ from gnuradio_mcp.oot_catalog import (
     build_install_example,
 )
 
+# Snapshot the catalog once so every test iterates the same, stable order
+_ENTRIES = tuple(CATALOG.values())
+_CATALOG_SIZE = len(_ENTRIES)
+MIN_CATALOG_SIZE = 15
+_PREINSTALLED_NAMES = frozenset(e.name for e in _ENTRIES if e.preinstalled)
+_INSTALLABLE_NAMES = frozenset(e.name for e in _ENTRIES if not e.preinstalled)
+CATALOG_PARAMS = tuple(CATALOG.items())
+catalog_params = pytest.mark.parametrize(
+    "name,entry", CATALOG_PARAMS, ids=list(CATALOG)
+)
+
 
 class TestCatalogIntegrity:
     def test_catalog_has_entries(self):
-        assert len(CATALOG) >= 15
+        assert _CATALOG_SIZE >= MIN_CATALOG_SIZE
 
-    def test_all_entries_have_git_url(self):
-        for name, entry in CATALOG.items():
-            assert entry.git_url.startswith("https://"), (
-                f"{name}: git_url must start with https://"
-            )
+    @catalog_params
+    def test_entry_structure(self, name, entry):
+        assert entry.git_url.startswith("https://"), "git_url must start with https://"
+        assert entry.category, "category must not be empty"
+        assert entry.description, "description must not be empty"
+        assert name == entry.name, f"key does not match entry name '{entry.name}'"
 
     def test_module_names_unique(self):
-        names = [e.name for e in CATALOG.values()]
-        assert len(names) == len(set(names))
+        assert len({e.name for e in _ENTRIES}) == _CATALOG_SIZE
 
-    def test_all_categories_nonempty(self):
-        for name, entry in CATALOG.items():
-            assert entry.category, f"{name}: category must not be empty"
+    def test_catalog_is_read_only(self):
+        with pytest.raises(TypeError):
+            CATALOG["new_module"] = CATALOG["lora_sdr"]
 
-    def test_all_entries_have_description(self):
-        for name, entry in CATALOG.items():
-            assert entry.description, f"{name}: description must not be empty"
-
-    def test_catalog_keys_match_entry_names(self):
-        for key, entry in CATALOG.items():
-            assert key == entry.name, (
-                f"Key '{key}' does not match entry name '{entry.name}'"
-            )
+    def test_entries_are_frozen(self):
+        with pytest.raises(ValidationError):
+            CATALOG["lora_sdr"].branch = "main"
 
     def test_unknown_module_not_in_catalog(self):
         assert CATALOG.get("nonexistent") is None
 
     def test_has_preinstalled_modules(self):
-        preinstalled = [e for e in CATALOG.values() if e.preinstalled]
-        assert len(preinstalled) >= 5
+        assert len(_PREINSTALLED_NAMES) >= 5
 
     def test_has_installable_modules(self):
-        installable = [e for e in CATALOG.values() if not e.preinstalled]
-        assert len(installable) >= 5
+        assert len(_INSTALLABLE_NAMES) >= 5
 
     def test_known_preinstalled_modules(self):
         expected = {"osmosdr", "satellites", "gsm", "rds", "fosphor"}
-        preinstalled_names = {
-            e.name for e in CATALOG.values() if e.preinstalled
-        }
-        assert expected.issubset(preinstalled_names)
+        assert expected.issubset(_PREINSTALLED_NAMES)
 
     def test_known_installable_modules(self):
         expected = {"lora_sdr", "ieee802_11", "adsb", "iridium"}
-        installable_names = {
-            e.name for e in CATALOG.values() if not e.preinstalled
-        }
-        assert expected.issubset(installable_names)
+        assert expected.issubset(_INSTALLABLE_NAMES)
 
 
 class TestModels:
@@ -77,12 +73,22 @@ class TestModels:
             preinstalled=True,
             installed=True,
         )
-        data = json.loads(summary.model_dump_json())
-        restored = OOTModuleSummary(**data)
+        restored = OOTModuleSummary.model_validate(summary.model_dump())
         assert restored.name == "test_mod"
         assert restored.preinstalled is True
         assert restored.installed is True
 
+    def test_summary_json_round_trip(self):
+        # Resources are served via model_dump_json, so cover that path too
+        summary = OOTModuleSummary(
+            name="test_mod",
+            description="A test module",
+            category="Testing",
+            installed=False,
+        )
+        restored = OOTModuleSummary.model_validate_json(summary.model_dump_json())
+        assert restored == summary
+
     def test_summary_installed_default_none(self):
         summary = OOTModuleSummary(
             name="x", description="y", category="z"
@@ -125,61 +131,74 @@ class TestModels:
         assert detail.preinstalled is True
 
     def test_directory_index_count(self):
+        # Trusted literals; validation is covered by the summary tests above
         summaries = [
-            OOTModuleSummary(name="a", description="A", category="X"),
-            OOTModuleSummary(
+            OOTModuleSummary.model_construct(
+                name="a", description="A", category="X", preinstalled=False
+            ),
+            OOTModuleSummary.model_construct(
                 name="b", description="B", category="Y", preinstalled=True
             ),
         ]
-        index = OOTDirectoryIndex(modules=summaries, count=2)
+        index = OOTDirectoryIndex.model_construct(modules=summaries, count=2)
         assert index.count == 2
         assert len(index.modules) == 2
         assert index.modules[1].preinstalled is True
 
 
+ADSB_ENTRY = OOTModuleEntry(
+    name="adsb",
+    description="ADS-B decoder",
+    category="Aviation",
+    git_url="https://github.com/mhostetter/gr-adsb",
+    branch="main",
+)
+LORA_ENTRY = OOTModuleEntry(
+    name="lora_sdr",
+    description="LoRa",
+    category="IoT",
+    git_url="https://github.com/tapparelj/gr-lora_sdr",
+    branch="master",
+)
+OSMOSDR_ENTRY = OOTModuleEntry(
+    name="osmosdr",
+    description="HW source/sink",
+    category="Hardware",
+    git_url="https://github.com/osmocom/gr-osmosdr",
+    branch="master",
+    build_deps=["librtlsdr-dev", "libairspy-dev"],
+)
+
+
 class TestBuildInstallExample:
     def test_simple_module(self):
-        entry = OOTModuleEntry(
-            name="adsb",
-            description="ADS-B decoder",
-            category="Aviation",
-            git_url="https://github.com/mhostetter/gr-adsb",
-            branch="main",
-        )
-        example = build_install_example(entry)
+        example = build_install_example(ADSB_ENTRY)
         assert "git_url=" in example
         assert "gr-adsb" in example
         # branch=main is the default, should not appear
         assert "branch=" not in example
 
     def test_non_default_branch(self):
-        entry = OOTModuleEntry(
-            name="lora_sdr",
-            description="LoRa",
-            category="IoT",
-            git_url="https://github.com/tapparelj/gr-lora_sdr",
-            branch="master",
-        )
-        example = build_install_example(entry)
+        example = build_install_example(LORA_ENTRY)
         assert 'branch="master"' in example
 
     def test_with_build_deps(self):
-        entry = OOTModuleEntry(
-            name="osmosdr",
-            description="HW source/sink",
-            category="Hardware",
-            git_url="https://github.com/osmocom/gr-osmosdr",
-            branch="master",
-            build_deps=["librtlsdr-dev", "libairspy-dev"],
-        )
-        example = build_install_example(entry)
+        example = build_install_example(OSMOSDR_ENTRY)
         assert "build_deps=" in example
         assert "librtlsdr-dev" in example
 
-    def test_all_catalog_entries_produce_example(self):
-        for name, entry in CATALOG.items():
-            example = build_install_example(entry)
-            assert example.startswith("install_oot_module("), (
-                f"{name}: bad install example"
-            )
-            assert example.endswith(")")
+    def test_catalog_entry_example_is_cached(self):
+        entry = CATALOG["lora_sdr"]
+        assert build_install_example(entry) is build_install_example(entry)
+
+    def test_adhoc_entry_with_catalog_name_not_cached(self):
+        entry = CATALOG["lora_sdr"].model_copy(
+            update={"git_url": "https://example.com/gr-lora_sdr-fork"}
+        )
+        assert "gr-lora_sdr-fork" in build_install_example(entry)
+
+    @catalog_params
+    def test_catalog_entry_produces_example(self, name, entry):
+        example = build_install_example(entry)
+        assert example.startswith("install_oot_module(")
+        assert example.endswith(")")
@@ -5,7 +5,9 @@ image naming, and OOT module detection — all without requiring Docker.
 """
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -16,16 +18,28 @@ from gnuradio_mcp.models import ComboImageInfo, OOTDetectionResult, OOTImageInfo
 
 @pytest.fixture
 def mock_docker_client():
-    return MagicMock()
+    # Only the images API is used; a fixed shape avoids MagicMock building
+    # attribute trees on demand and fails loudly on any other client call.
+    return SimpleNamespace(
+        images=SimpleNamespace(get=MagicMock(), build=MagicMock(), remove=MagicMock())
+    )
+
+
+@pytest.fixture(scope="class")
+def registry_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("oot-registry")
 
 
 @pytest.fixture
-def oot(mock_docker_client, tmp_path):
+def oot(mock_docker_client, registry_dir):
     mw = OOTInstallerMiddleware(mock_docker_client)
-    # Override registry paths to use tmp_path
-    mw._registry_path = tmp_path / "oot-registry.json"
+    # Override registry paths; the directory is shared per class, so start
+    # each test without the files a previous test may have saved
+    mw._registry_path = registry_dir / "oot-registry.json"
+    mw._registry_path.unlink(missing_ok=True)
     mw._registry = {}
-    mw._combo_registry_path = tmp_path / "oot-combo-registry.json"
+    mw._combo_registry_path = registry_dir / "oot-combo-registry.json"
+    mw._combo_registry_path.unlink(missing_ok=True)
     mw._combo_registry = {}
     return mw
 
@@ -36,49 +50,45 @@ def oot(mock_docker_client, tmp_path):
 
 
 class TestModuleNameFromUrl:
-    def test_gr_prefix_stripped(self):
-        name = OOTInstallerMiddleware._module_name_from_url(
-            "https://github.com/tapparelj/gr-lora_sdr.git"
-        )
-        assert name == "lora_sdr"
-
-    def test_gr_prefix_no_git_suffix(self):
-        name = OOTInstallerMiddleware._module_name_from_url(
-            "https://github.com/osmocom/gr-osmosdr"
-        )
-        assert name == "osmosdr"
-
-    def test_no_gr_prefix(self):
-        name = OOTInstallerMiddleware._module_name_from_url(
-            "https://github.com/gnuradio/volk.git"
-        )
-        assert name == "volk"
-
-    def test_trailing_slash(self):
-        name = OOTInstallerMiddleware._module_name_from_url(
-            "https://github.com/tapparelj/gr-lora_sdr/"
-        )
-        assert name == "lora_sdr"
-
-    def test_gr_satellites(self):
-        name = OOTInstallerMiddleware._module_name_from_url(
-            "https://github.com/daniestevez/gr-satellites.git"
-        )
-        assert name == "satellites"
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://github.com/tapparelj/gr-lora_sdr.git", "lora_sdr"),
+            ("https://github.com/osmocom/gr-osmosdr", "osmosdr"),
+            ("https://github.com/gnuradio/volk.git", "volk"),
+            ("https://github.com/tapparelj/gr-lora_sdr/", "lora_sdr"),
+            ("https://github.com/daniestevez/gr-satellites.git", "satellites"),
+            ("git@github.com:bastibl/gr-foo.git", "foo"),
+        ],
+        ids=[
+            "gr_prefix_stripped",
+            "gr_prefix_no_git_suffix",
+            "no_gr_prefix",
+            "trailing_slash",
+            "gr_satellites",
+            "ssh_url",
+        ],
+    )
+    def test_module_name_from_url(self, url, expected):
+        assert OOTInstallerMiddleware._module_name_from_url(url) == expected
 
 
 class TestRepoDirFromUrl:
-    def test_preserves_gr_prefix(self):
-        d = OOTInstallerMiddleware._repo_dir_from_url(
-            "https://github.com/tapparelj/gr-lora_sdr.git"
-        )
-        assert d == "gr-lora_sdr"
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://github.com/tapparelj/gr-lora_sdr.git", "gr-lora_sdr"),
+            ("https://github.com/osmocom/gr-osmosdr", "gr-osmosdr"),
+            ("git@github.com:bastibl/gr-foo.git", "gr-foo"),
+        ],
+        ids=["preserves_gr_prefix", "no_git_suffix", "ssh_url"],
+    )
+    def test_repo_dir_from_url(self, url, expected):
+        assert OOTInstallerMiddleware._repo_dir_from_url(url) == expected
 
-    def test_no_git_suffix(self):
-        d = OOTInstallerMiddleware._repo_dir_from_url(
-            "https://github.com/osmocom/gr-osmosdr"
-        )
-        assert d == "gr-osmosdr"
+    def test_unparseable_url_raises(self):
+        with pytest.raises(ValueError, match="Cannot determine repository name"):
+            OOTInstallerMiddleware._repo_dir_from_url("")
 
 
 # ──────────────────────────────────────────
@@ -86,23 +96,36 @@ class TestRepoDirFromUrl:
 # ──────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def basic_dockerfile() -> str:
+    """Dockerfile for the default lora_sdr build, rendered once per module."""
+    return OOTInstallerMiddleware(MagicMock()).generate_dockerfile(
+        git_url="https://github.com/tapparelj/gr-lora_sdr.git",
+        branch="master",
+        base_image="gnuradio-runtime:latest",
+    )
+
+
 class TestDockerfileGeneration:
-    def test_basic_dockerfile(self, oot):
-        dockerfile = oot.generate_dockerfile(
-            git_url="https://github.com/tapparelj/gr-lora_sdr.git",
-            branch="master",
-            base_image="gnuradio-runtime:latest",
-        )
-        assert "FROM gnuradio-runtime:latest" in dockerfile
-        assert "git clone --depth 1 --branch master" in dockerfile
-        assert "https://github.com/tapparelj/gr-lora_sdr.git" in dockerfile
-        assert "cd gr-lora_sdr" in dockerfile
-        assert "fix_binding_hashes.py" in dockerfile
-        assert "mkdir build" in dockerfile
-        assert "cmake -DCMAKE_INSTALL_PREFIX=/usr" in dockerfile
-        assert "make -j$(nproc)" in dockerfile
-        assert "ldconfig" in dockerfile
-        assert "PYTHONPATH" in dockerfile
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "FROM gnuradio-runtime:latest",
+            "git clone --depth 1 --branch master",
+            "https://github.com/tapparelj/gr-lora_sdr.git",
+            "cd gr-lora_sdr",
+            "fix_binding_hashes.py",
+            "mkdir build",
+            "cmake -DCMAKE_INSTALL_PREFIX=/usr",
+            "make -j$(nproc)",
+            "ldconfig",
+            "PYTHONPATH",
+            # With no extra deps, the apt-get line should still work
+            "build-essential cmake git",
+        ],
+    )
+    def test_basic_dockerfile(self, basic_dockerfile, needle):
+        assert needle in basic_dockerfile
 
     def test_with_extra_build_deps(self, oot):
         dockerfile = oot.generate_dockerfile(
@@ -130,15 +153,6 @@ class TestDockerfileGeneration:
         )
         assert "FROM gnuradio-coverage:latest" in dockerfile
 
-    def test_no_extra_deps_no_trailing_space(self, oot):
-        dockerfile = oot.generate_dockerfile(
-            git_url="https://github.com/tapparelj/gr-lora_sdr.git",
-            branch="master",
-            base_image="gnuradio-runtime:latest",
-        )
-        # With no extra deps, the apt-get line should still work
-        assert "build-essential cmake git" in dockerfile
-
 
 # ──────────────────────────────────────────
 # Registry Persistence
@@ -175,6 +189,13 @@ class TestRegistry:
         result = mw._load_registry()
         assert result == {}
 
+    def test_load_unreadable_path_returns_empty(self, tmp_path):
+        # A directory in place of the file fails with an OSError other than
+        # FileNotFoundError; startup must not crash on it
+        mw = OOTInstallerMiddleware(MagicMock())
+        mw._registry_path = tmp_path
+        assert mw._load_registry() == {}
+
     def test_load_corrupt_file_returns_empty(self, oot):
         oot._registry_path.write_text("not valid json{{{")
         result = oot._load_registry()
@@ -187,6 +208,12 @@ class TestRegistry:
         mw._save_registry()
         assert mw._registry_path.exists()
 
+    def test_save_leaves_no_temp_file(self, oot):
+        oot._save_registry()
+        assert [p.name for p in oot._registry_path.parent.iterdir()] == [
+            "oot-registry.json"
+        ]
+
     def test_load_skips_corrupt_entries(self, oot):
         """Per-entry validation: one corrupt entry doesn't nuke valid ones."""
         data = {
@@ -359,47 +386,59 @@ def _make_oot_info(name: str, tag: str) -> OOTImageInfo:
     )
 
 
-class TestComboDockerfileGeneration:
-    def test_multi_stage_structure(self, oot):
-        oot._registry["adsb"] = _make_oot_info("adsb", "gr-oot-adsb:main-abc1234")
-        oot._registry["lora_sdr"] = _make_oot_info(
-            "lora_sdr", "gr-oot-lora_sdr:master-def5678"
-        )
-
-        dockerfile = oot.generate_combo_dockerfile(["lora_sdr", "adsb"])
+@pytest.fixture(scope="module")
+def oot_infos() -> Mapping[str, OOTImageInfo]:
+    """Canonical single-OOT images shared (read-only) across combo tests."""
+    return MappingProxyType(
+        {
+            "adsb": _make_oot_info("adsb", "gr-oot-adsb:main-abc1234"),
+            "lora_sdr": _make_oot_info("lora_sdr", "gr-oot-lora_sdr:master-def5678"),
+        }
+    )
 
-        # Stage aliases (sorted order: adsb first)
-        assert "FROM gr-oot-adsb:main-abc1234 AS stage_adsb" in dockerfile
-        assert "FROM gr-oot-lora_sdr:master-def5678 AS stage_lora_sdr" in dockerfile
 
-        # Final base image
-        assert "FROM gnuradio-runtime:latest" in dockerfile
+@pytest.fixture(scope="module")
+def combo_dockerfile_lines(oot_infos) -> frozenset[str]:
+    """Lines of the adsb + lora_sdr combo Dockerfile, rendered once per module."""
+    mw = OOTInstallerMiddleware(MagicMock())
+    mw._registry = dict(oot_infos)
+    return frozenset(mw.generate_combo_dockerfile(["lora_sdr", "adsb"]).splitlines())
 
-        # COPY directives for both modules
-        assert "COPY --from=stage_adsb /usr/lib/ /usr/lib/" in dockerfile
-        assert "COPY --from=stage_adsb /usr/include/ /usr/include/" in dockerfile
-        assert "COPY --from=stage_adsb /usr/share/gnuradio/ /usr/share/gnuradio/" in dockerfile
-        assert "COPY --from=stage_lora_sdr /usr/lib/ /usr/lib/" in dockerfile
-        assert "COPY --from=stage_lora_sdr /usr/include/ /usr/include/" in dockerfile
 
-        # Runtime setup
-        assert "RUN ldconfig" in dockerfile
-        assert "WORKDIR /flowgraphs" in dockerfile
-        assert "PYTHONPATH" in dockerfile
+class TestComboDockerfileGeneration:
+    @pytest.mark.parametrize(
+        "line",
+        [
+            # Stage aliases (sorted order: adsb first)
+            "FROM gr-oot-adsb:main-abc1234 AS stage_adsb",
+            "FROM gr-oot-lora_sdr:master-def5678 AS stage_lora_sdr",
+            # Final base image
+            "FROM gnuradio-runtime:latest",
+            # COPY directives for both modules
+            "COPY --from=stage_adsb /usr/lib/ /usr/lib/",
+            "COPY --from=stage_adsb /usr/include/ /usr/include/",
+            "COPY --from=stage_adsb /usr/share/gnuradio/ /usr/share/gnuradio/",
+            "COPY --from=stage_lora_sdr /usr/lib/ /usr/lib/",
+            "COPY --from=stage_lora_sdr /usr/include/ /usr/include/",
+            # Runtime setup
+            "RUN ldconfig",
+            "WORKDIR /flowgraphs",
+            'ENV PYTHONPATH="/usr/lib/python3.11/site-packages:${PYTHONPATH}"',
+        ],
+    )
+    def test_multi_stage_structure(self, combo_dockerfile_lines, line):
+        assert line in combo_dockerfile_lines
 
-    def test_missing_module_raises(self, oot):
-        oot._registry["adsb"] = _make_oot_info("adsb", "gr-oot-adsb:main-abc1234")
+    def test_missing_module_raises(self, oot, oot_infos):
+        oot._registry["adsb"] = oot_infos["adsb"]
 
         with pytest.raises(ValueError, match="lora_sdr"):
             oot.generate_combo_dockerfile(["adsb", "lora_sdr"])
 
-    def test_uses_configured_base_image(self, mock_docker_client, tmp_path):
+    def test_uses_configured_base_image(self, mock_docker_client, tmp_path, oot_infos):
         mw = OOTInstallerMiddleware(mock_docker_client, base_image="my-custom:v2")
         mw._registry_path = tmp_path / "oot-registry.json"
-        mw._registry = {
-            "adsb": _make_oot_info("adsb", "gr-oot-adsb:main-abc1234"),
-            "lora_sdr": _make_oot_info("lora_sdr", "gr-oot-lora_sdr:main-def5678"),
-        }
+        mw._registry = dict(oot_infos)
         mw._combo_registry_path = tmp_path / "oot-combo-registry.json"
         mw._combo_registry = {}
 
@@ -422,14 +461,11 @@ class TestComboRegistry:
         assert oot._combo_registry == {}
         assert oot.list_combo_images() == []
 
-    def test_save_and_load_roundtrip(self, oot):
+    def test_save_and_load_roundtrip(self, oot, oot_infos):
         info = ComboImageInfo(
             combo_key="combo:adsb+lora_sdr",
             image_tag="gr-combo-adsb-lora_sdr:latest",
-            modules=[
-                _make_oot_info("adsb", "gr-oot-adsb:main-abc1234"),
-                _make_oot_info("lora_sdr", "gr-oot-lora_sdr:master-def5678"),
-            ],
+            modules=list(oot_infos.values()),
             built_at="2025-01-01T00:00:00+00:00",
         )
         oot._combo_registry["combo:adsb+lora_sdr"] = info
@@ -513,10 +549,9 @@ class TestBuildComboImage:
         assert result.success is False
         assert "2 distinct" in result.error
 
-    def test_idempotent_skip(self, oot, mock_docker_client):
+    def test_idempotent_skip(self, oot, mock_docker_client, oot_infos):
         """Skips build if combo image already exists."""
-        oot._registry["adsb"] = _make_oot_info("adsb", "gr-oot-adsb:main-abc")
-        oot._registry["lora_sdr"] = _make_oot_info("lora_sdr", "gr-oot-lora:m-def")
+        oot._registry.update(oot_infos)
 
         existing = ComboImageInfo(
             combo_key="combo:adsb+lora_sdr",
@@ -533,12 +568,9 @@ class TestBuildComboImage:
         assert result.success is True
         assert result.skipped is True
 
-    def test_happy_path(self, oot, mock_docker_client):
+    def test_happy_path(self, oot, mock_docker_client, oot_infos):
         """Builds combo from pre-existing single-OOT images."""
-        oot._registry["adsb"] = _make_oot_info("adsb", "gr-oot-adsb:main-abc1234")
-        oot._registry["lora_sdr"] = _make_oot_info(
-            "lora_sdr", "gr-oot-lora_sdr:master-def5678"
-        )
+        oot._registry.update(oot_infos)
 
         # Docker image does not exist yet
         mock_docker_client.images.get.side_effect = Exception("not found")
@@ -559,20 +591,21 @@ class TestBuildComboImage:
 
         # Verify persisted to combo registry
         assert "combo:adsb+lora_sdr" in oot._combo_registry
+        # No combo registry entry, so Docker is never asked whether it exists
+        mock_docker_client.images.get.assert_not_called()
 
-    def test_unknown_module_not_in_catalog(self, oot):
+    def test_unknown_module_not_in_catalog(self, oot, oot_infos):
         """Fails if module not in registry and not in catalog."""
-        oot._registry["adsb"] = _make_oot_info("adsb", "gr-oot-adsb:main-abc1234")
+        oot._registry["adsb"] = oot_infos["adsb"]
 
         result = oot.build_combo_image(["adsb", "totally_fake_module"])
         assert result.success is False
         assert "totally_fake_module" in result.error
         assert "not found in the catalog" in result.error
 
-    def test_force_rebuilds(self, oot, mock_docker_client):
+    def test_force_rebuilds(self, oot, mock_docker_client, oot_infos):
         """force=True bypasses idempotency check."""
-        oot._registry["adsb"] = _make_oot_info("adsb", "gr-oot-adsb:main-abc")
-        oot._registry["lora_sdr"] = _make_oot_info("lora_sdr", "gr-oot-lora:m-def")
+        oot._registry.update(oot_infos)
 
         existing = ComboImageInfo(
             combo_key="combo:adsb+lora_sdr",
@@ -666,6 +699,21 @@ class TestDetectFromPython:
 
 
 class TestDetectFromGrc:
+    @pytest.mark.parametrize(
+        "block_id,expected",
+        [
+            ("lora_sdr_gray_demap", "lora_sdr"),
+            ("osmosdr", "osmosdr"),
+            ("ieee802_15_4_mac", "ieee802_15_4"),
+            ("ieee802_1x_source", None),
+        ],
+    )
+    def test_catalog_module_for_block(self, block_id, expected):
+        from gnuradio_mcp.oot_catalog import CATALOG
+
+        found = OOTInstallerMiddleware._catalog_module_for_block(block_id, CATALOG)
+        assert found == expected
+
     def test_detects_prefixed_blocks(self, oot, tmp_path):
         """Detects blocks with OOT module prefix."""
         grc_file = tmp_path / "test.grc"
@@ -785,13 +833,11 @@ class TestRecommendImage:
         result = oot._recommend_image([])
         assert result == "gnuradio-runtime:latest"
 
-    def test_recommends_single_oot_image_if_built(self, oot):
+    def test_recommends_single_oot_image_if_built(self, oot, oot_infos):
         """Returns single OOT image tag if already built."""
-        oot._registry["lora_sdr"] = _make_oot_info(
-            "lora_sdr", "gr-oot-lora_sdr:master-abc1234"
-        )
+        oot._registry["lora_sdr"] = oot_infos["lora_sdr"]
         result = oot._recommend_image(["lora_sdr"])
-        assert result == "gr-oot-lora_sdr:master-abc1234"
+        assert result == "gr-oot-lora_sdr:master-def5678"
 
     def test_returns_none_if_single_not_built(self, oot):
         """Returns None if single module not yet built."""
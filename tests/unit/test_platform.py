@@ -18,3 +18,7 @@ def test_platform_middleware_blocks(platform: Platform):
     block_models = middleware.blocks
     assert block_models  # Checks that the list is not empty
     assert all(isinstance(block_model, BlockTypeModel) for block_model in block_models)
+
+
+def test_platform_middleware_blocks_count(platform_middleware: PlatformMiddleware):
+    assert platform_middleware.blocks_count == len(platform_middleware.blocks)
@@ -9,6 +9,7 @@ from gnuradio_mcp.middlewares.ports import (
     detect_xmlrpc_port,
     find_free_port,
     is_port_available,
+    patch_flowgraph,
     patch_xmlrpc_port,
 )
 
@@ -35,6 +36,27 @@ class top_block:
         self.source = some_source()
 """
 
+# Encoded once; the tests write these to disk many times
+SAMPLE_FLOWGRAPH_BYTES = SAMPLE_FLOWGRAPH.encode()
+SAMPLE_FLOWGRAPH_9999_BYTES = SAMPLE_FLOWGRAPH.replace("8080", "9999").encode()
+SAMPLE_NO_XMLRPC_BYTES = SAMPLE_NO_XMLRPC.encode()
+
+
+@pytest.fixture(scope="class")
+def sample_flowgraph(tmp_path_factory):
+    """SAMPLE_FLOWGRAPH on disk, written once per class; tests must not modify it."""
+    fg = tmp_path_factory.mktemp("fg") / "flowgraph.py"
+    fg.write_bytes(SAMPLE_FLOWGRAPH_BYTES)
+    return fg
+
+
+@pytest.fixture(scope="class")
+def sample_no_xmlrpc(tmp_path_factory):
+    """SAMPLE_NO_XMLRPC on disk, written once per class; tests must not modify it."""
+    fg = tmp_path_factory.mktemp("fg") / "no_xmlrpc.py"
+    fg.write_bytes(SAMPLE_NO_XMLRPC_BYTES)
+    return fg
+
 
 class TestIsPortAvailable:
     def test_free_port_is_available(self):
@@ -69,53 +91,101 @@ class TestFindFreePort:
 
 
 class TestDetectXmlrpcPort:
-    def test_detects_port(self, tmp_path):
-        fg = tmp_path / "flowgraph.py"
-        fg.write_text(SAMPLE_FLOWGRAPH)
-        assert detect_xmlrpc_port(fg) == 8080
+    def test_detects_port(self, sample_flowgraph):
+        assert detect_xmlrpc_port(sample_flowgraph) == 8080
 
-    def test_returns_none_when_missing(self, tmp_path):
-        fg = tmp_path / "no_xmlrpc.py"
-        fg.write_text(SAMPLE_NO_XMLRPC)
-        assert detect_xmlrpc_port(fg) is None
+    def test_returns_none_when_missing(self, sample_no_xmlrpc):
+        assert detect_xmlrpc_port(sample_no_xmlrpc) is None
 
     def test_detects_different_port(self, tmp_path):
         fg = tmp_path / "custom.py"
-        fg.write_text(SAMPLE_FLOWGRAPH.replace("8080", "9999"))
+        fg.write_bytes(SAMPLE_FLOWGRAPH_9999_BYTES)
         assert detect_xmlrpc_port(fg) == 9999
 
+    def test_detects_wrapped_constructor(self, tmp_path):
+        # Reformatted or hand-edited flowgraphs may split the call
+        fg = tmp_path / "wrapped.py"
+        fg.write_text(
+            "self.xmlrpc_server_0 = SimpleXMLRPCServer(\n"
+            "    ('localhost', 8181),\n"
+            "    allow_none=True,\n"
+            ")\n"
+        )
+        assert detect_xmlrpc_port(fg) == 8181
+
 
 class TestPatchXmlrpcPort:
-    def test_patches_port(self, tmp_path):
-        fg = tmp_path / "flowgraph.py"
-        fg.write_text(SAMPLE_FLOWGRAPH)
+    # patch_xmlrpc_port only adds uniquely named siblings, so the sample
+    # files can be shared across the class
 
-        patched = patch_xmlrpc_port(fg, 12345)
+    def test_patches_port(self, sample_flowgraph):
+        patched = patch_xmlrpc_port(sample_flowgraph, 12345)
         content = patched.read_text()
         assert "12345" in content
         assert "8080" not in content
 
-    def test_preserves_original(self, tmp_path):
-        fg = tmp_path / "flowgraph.py"
-        fg.write_text(SAMPLE_FLOWGRAPH)
-        original_text = fg.read_text()
+    def test_preserves_original(self, sample_flowgraph):
+        patch_xmlrpc_port(sample_flowgraph, 12345)
+        assert sample_flowgraph.read_text() == SAMPLE_FLOWGRAPH
 
-        patch_xmlrpc_port(fg, 12345)
-        assert fg.read_text() == original_text
+    def test_patched_file_in_same_directory(self, sample_flowgraph):
+        patched = patch_xmlrpc_port(sample_flowgraph, 12345)
+        assert patched.parent == sample_flowgraph.parent
 
-    def test_patched_file_in_same_directory(self, tmp_path):
+    def test_raises_on_no_match(self, sample_no_xmlrpc):
+        with pytest.raises(ValueError, match="No SimpleXMLRPCServer"):
+            patch_xmlrpc_port(sample_no_xmlrpc, 12345)
+
+
+class TestPatchFlowgraph:
+    def test_no_changes_returns_original(self, tmp_path):
+        fg = tmp_path / "no_xmlrpc.py"
+        fg.write_bytes(SAMPLE_NO_XMLRPC_BYTES)
+
+        assert patch_flowgraph(fg) == fg
+
+    def test_patched_name_is_content_addressed(self, tmp_path):
         fg = tmp_path / "flowgraph.py"
-        fg.write_text(SAMPLE_FLOWGRAPH)
+        fg.write_bytes(SAMPLE_FLOWGRAPH_BYTES)
 
-        patched = patch_xmlrpc_port(fg, 12345)
+        patched = patch_flowgraph(fg, xmlrpc_port=12345)
         assert patched.parent == fg.parent
+        assert patched.name.startswith("flowgraph.")
+        assert patched.name.endswith(".patched.py")
 
-    def test_raises_on_no_match(self, tmp_path):
-        fg = tmp_path / "no_xmlrpc.py"
-        fg.write_text(SAMPLE_NO_XMLRPC)
+    def test_reuses_existing_patched_file(self, tmp_path):
+        fg = tmp_path / "flowgraph.py"
+        fg.write_bytes(SAMPLE_FLOWGRAPH_BYTES)
 
-        with pytest.raises(ValueError, match="No SimpleXMLRPCServer"):
-            patch_xmlrpc_port(fg, 12345)
+        first = patch_flowgraph(fg, xmlrpc_port=12345)
+        mtime = first.stat().st_mtime_ns
+        second = patch_flowgraph(fg, xmlrpc_port=12345)
+
+        assert second == first
+        assert second.stat().st_mtime_ns == mtime
+        assert len(list(tmp_path.glob("*.patched.py"))) == 1
+
+    def test_partial_patched_file_is_rewritten(self, tmp_path):
+        fg = tmp_path / "flowgraph.py"
+        fg.write_bytes(SAMPLE_FLOWGRAPH_BYTES)
+        patched = patch_flowgraph(fg, xmlrpc_port=12345)
+        expected = patched.read_bytes()
+
+        # Simulate a write that was interrupted halfway
+        patched.write_bytes(expected[: len(expected) // 2])
+
+        assert patch_flowgraph(fg, xmlrpc_port=12345) == patched
+        assert patched.read_bytes() == expected
+        # The temp file was renamed into place, not left behind
+        assert set(tmp_path.iterdir()) == {fg, patched}
+
+    def test_different_port_gets_different_file(self, tmp_path):
+        fg = tmp_path / "flowgraph.py"
+        fg.write_bytes(SAMPLE_FLOWGRAPH_BYTES)
+
+        assert patch_flowgraph(fg, xmlrpc_port=12345) != patch_flowgraph(
+            fg, xmlrpc_port=23456
+        )
 
 
 class TestPortConflictError:
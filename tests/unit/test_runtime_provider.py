@@ -1,9 +1,13 @@
 """Unit tests for RuntimeProvider with mocked middlewares."""
 
-from unittest.mock import MagicMock, patch
+import subprocess
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
 import pytest
 
+from gnuradio_mcp.middlewares.docker import DockerMiddleware
+from gnuradio_mcp.middlewares.xmlrpc import XmlRpcMiddleware
 from gnuradio_mcp.models import (
     ConnectionInfoModel,
     ContainerModel,
@@ -13,53 +17,74 @@ from gnuradio_mcp.models import (
 )
 from gnuradio_mcp.providers.runtime import RuntimeProvider
 
+# Canned middleware responses, validated once; tests only read them
+SAMPLE_CONTAINER = ContainerModel(
+    name="gr-test",
+    container_id="abc123",
+    status="running",
+    flowgraph_path="/path/to/test.grc",
+    xmlrpc_port=8080,
+)
+SAMPLE_SCREENSHOT = ScreenshotModel(
+    container_name="gr-test",
+    image_base64="iVBORw0KGgo=",
+    format="png",
+)
+SAMPLE_CONNECTION = ConnectionInfoModel(
+    url="http://localhost:8080",
+    xmlrpc_port=8080,
+    methods=["get_freq", "set_freq"],
+)
+SAMPLE_VARIABLES = (
+    VariableModel(name="freq", value=1e6),
+    VariableModel(name="amp", value=0.5),
+)
+# Never opened: without an OOT middleware the provider only forwards the path
+FLOWGRAPH_PATH = "/virtual/test.grc"
+
+# What launch_flowgraph forwards to DockerMiddleware.launch by default
+DEFAULT_LAUNCH_KWARGS = MappingProxyType(
+    {
+        "xmlrpc_port": 0,
+        "enable_vnc": False,
+        "enable_coverage": False,
+        "enable_controlport": False,
+        "controlport_port": 9090,
+        "enable_perf_counters": True,
+        "device_paths": None,
+        "image": None,
+    }
+)
 
-@pytest.fixture
-def mock_docker_mw():
-    """Mock DockerMiddleware."""
-    mw = MagicMock()
-    mw.launch.return_value = ContainerModel(
-        name="gr-test",
-        container_id="abc123",
-        status="running",
-        flowgraph_path="/path/to/test.grc",
-        xmlrpc_port=8080,
+
+def assert_launched_with(mock_docker_mw, **overrides):
+    """Assert a single launch() call with the defaults plus ``overrides``."""
+    mock_docker_mw.launch.assert_called_once_with(
+        **{**DEFAULT_LAUNCH_KWARGS, **overrides}
     )
-    mw.list_containers.return_value = [
-        ContainerModel(
-            name="gr-test",
-            container_id="abc123",
-            status="running",
-            flowgraph_path="/path/to/test.grc",
-            xmlrpc_port=8080,
-        )
-    ]
+
+
+@pytest.fixture(scope="module")
+def mock_docker_mw():
+    """Mock DockerMiddleware, shared by the module (see _reset_mocks)."""
+    mw = MagicMock(spec=DockerMiddleware)
+    mw.launch.return_value = SAMPLE_CONTAINER
+    mw.list_containers.return_value = [SAMPLE_CONTAINER]
     mw.stop.return_value = True
     mw.remove.return_value = True
     mw.get_xmlrpc_port.return_value = 8080
-    mw.capture_screenshot.return_value = ScreenshotModel(
-        container_name="gr-test",
-        image_base64="iVBORw0KGgo=",
-        format="png",
-    )
+    mw.capture_screenshot.return_value = SAMPLE_SCREENSHOT
     mw.get_logs.return_value = "flowgraph started\n"
     return mw
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_xmlrpc_mw():
-    """Mock XmlRpcMiddleware."""
-    mw = MagicMock()
+    """Mock XmlRpcMiddleware, shared by the module (see _reset_mocks)."""
+    mw = MagicMock(spec=XmlRpcMiddleware)
     mw._url = "http://localhost:8080"
-    mw.get_connection_info.return_value = ConnectionInfoModel(
-        url="http://localhost:8080",
-        xmlrpc_port=8080,
-        methods=["get_freq", "set_freq"],
-    )
-    mw.list_variables.return_value = [
-        VariableModel(name="freq", value=1e6),
-        VariableModel(name="amp", value=0.5),
-    ]
+    mw.get_connection_info.return_value = SAMPLE_CONNECTION
+    mw.list_variables.return_value = list(SAMPLE_VARIABLES)
     mw.get_variable.return_value = 1e6
     mw.set_variable.return_value = True
     mw.start.return_value = True
@@ -69,10 +94,20 @@ def mock_xmlrpc_mw():
     return mw
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_docker_mw, mock_xmlrpc_mw):
+    """Clear call history and side effects; keep the canned return values."""
+    yield
+    mock_docker_mw.reset_mock(side_effect=True)
+    mock_xmlrpc_mw.reset_mock(side_effect=True)
+
+
 @pytest.fixture
-def provider_with_docker(mock_docker_mw):
-    """RuntimeProvider with Docker available."""
-    return RuntimeProvider(docker_mw=mock_docker_mw)
+def provider_with_docker(mock_docker_mw, mock_xmlrpc_mw):
+    """RuntimeProvider with Docker available; connects hand back the XML-RPC mock."""
+    return RuntimeProvider(
+        docker_mw=mock_docker_mw, xmlrpc_factory=lambda url: mock_xmlrpc_mw
+    )
 
 
 @pytest.fixture
@@ -110,48 +145,34 @@ class TestPreconditions:
 
 
 class TestContainerLifecycle:
-    def test_launch_flowgraph(self, provider_with_docker, mock_docker_mw, tmp_path):
-        fg = tmp_path / "test.grc"
-        fg.write_text("<flowgraph/>")
-
+    def test_launch_flowgraph(self, provider_with_docker, mock_docker_mw):
         result = provider_with_docker.launch_flowgraph(
-            flowgraph_path=str(fg),
+            flowgraph_path=FLOWGRAPH_PATH,
             name="my-fg",
             xmlrpc_port=9090,
             enable_vnc=True,
         )
 
         assert isinstance(result, ContainerModel)
-        mock_docker_mw.launch.assert_called_once_with(
-            flowgraph_path=str(fg),
+        assert_launched_with(
+            mock_docker_mw,
+            flowgraph_path=FLOWGRAPH_PATH,
             name="my-fg",
             xmlrpc_port=9090,
             enable_vnc=True,
-            enable_coverage=False,
-            enable_controlport=False,
-            controlport_port=9090,
-            enable_perf_counters=True,
-            device_paths=None,
-            image=None,
         )
 
-    def test_launch_flowgraph_auto_name(
-        self, provider_with_docker, mock_docker_mw, tmp_path
-    ):
-        fg = tmp_path / "siggen_xmlrpc.grc"
-        fg.write_text("<flowgraph/>")
-
-        provider_with_docker.launch_flowgraph(flowgraph_path=str(fg))
+    def test_launch_flowgraph_auto_name(self, provider_with_docker, mock_docker_mw):
+        provider_with_docker.launch_flowgraph(
+            flowgraph_path="/virtual/siggen_xmlrpc.grc"
+        )
 
         call_kwargs = mock_docker_mw.launch.call_args
         assert call_kwargs.kwargs["name"] == "gr-siggen_xmlrpc"
 
-    def test_launch_flowgraph_requires_docker(self, provider_no_docker, tmp_path):
-        fg = tmp_path / "test.grc"
-        fg.write_text("<flowgraph/>")
-
+    def test_launch_flowgraph_requires_docker(self, provider_no_docker):
         with pytest.raises(RuntimeError, match="Docker is not available"):
-            provider_no_docker.launch_flowgraph(str(fg))
+            provider_no_docker.launch_flowgraph(FLOWGRAPH_PATH)
 
     def test_list_containers(self, provider_with_docker, mock_docker_mw):
         result = provider_with_docker.list_containers()
@@ -172,36 +193,24 @@ class TestContainerLifecycle:
 
 class TestConnectionManagement:
     def test_connect(self, provider_with_docker, mock_xmlrpc_mw):
-        with patch(
-            "gnuradio_mcp.providers.runtime.XmlRpcMiddleware.connect",
-            return_value=mock_xmlrpc_mw,
-        ):
-            result = provider_with_docker.connect("http://localhost:8080")
+        result = provider_with_docker.connect("http://localhost:8080")
 
-            assert isinstance(result, ConnectionInfoModel)
-            assert provider_with_docker._xmlrpc is mock_xmlrpc_mw
-            assert provider_with_docker._active_container is None
+        assert isinstance(result, ConnectionInfoModel)
+        assert provider_with_docker._xmlrpc is mock_xmlrpc_mw
+        assert provider_with_docker._active_container is None
 
     def test_connect_parses_port(self, provider_with_docker, mock_xmlrpc_mw):
-        with patch(
-            "gnuradio_mcp.providers.runtime.XmlRpcMiddleware.connect",
-            return_value=mock_xmlrpc_mw,
-        ):
-            provider_with_docker.connect("http://localhost:9090")
-            mock_xmlrpc_mw.get_connection_info.assert_called_with(xmlrpc_port=9090)
+        provider_with_docker.connect("http://localhost:9090")
+        mock_xmlrpc_mw.get_connection_info.assert_called_with(xmlrpc_port=9090)
 
     def test_connect_to_container(
         self, provider_with_docker, mock_docker_mw, mock_xmlrpc_mw
     ):
-        with patch(
-            "gnuradio_mcp.providers.runtime.XmlRpcMiddleware.connect",
-            return_value=mock_xmlrpc_mw,
-        ):
-            result = provider_with_docker.connect_to_container("gr-test")
+        result = provider_with_docker.connect_to_container("gr-test")
 
-            assert isinstance(result, ConnectionInfoModel)
-            assert provider_with_docker._active_container == "gr-test"
-            mock_docker_mw.get_xmlrpc_port.assert_called_once_with("gr-test")
+        assert isinstance(result, ConnectionInfoModel)
+        assert provider_with_docker._active_container == "gr-test"
+        mock_docker_mw.get_xmlrpc_port.assert_called_once_with("gr-test")
 
     def test_disconnect(self, provider_with_docker, mock_xmlrpc_mw):
         provider_with_docker._xmlrpc = mock_xmlrpc_mw
@@ -238,6 +247,29 @@ class TestConnectionManagement:
         assert result.connection is not None
         mock_xmlrpc_mw.get_connection_info.assert_called()
 
+    def test_get_status_reuses_connection_info(
+        self, provider_with_docker, mock_xmlrpc_mw
+    ):
+        provider_with_docker.connect("http://localhost:8080")
+
+        provider_with_docker.get_status()
+        result = provider_with_docker.get_status()
+
+        assert result.connection == SAMPLE_CONNECTION
+        # Fetched once at connect time, not once per status poll
+        mock_xmlrpc_mw.get_connection_info.assert_called_once()
+
+    def test_failed_reconnect_drops_previous_connection_info(
+        self, provider_with_docker, mock_xmlrpc_mw
+    ):
+        provider_with_docker.connect("http://localhost:8080")
+        mock_xmlrpc_mw.get_connection_info.side_effect = ConnectionError("timeout")
+
+        with pytest.raises(ConnectionError):
+            provider_with_docker.connect_to_container("gr-test")
+
+        assert provider_with_docker._connection_info is None
+
     def test_get_status_handles_docker_error(
         self, provider_with_docker, mock_docker_mw
     ):
@@ -280,25 +312,13 @@ class TestVariableControl:
 
 
 class TestFlowgraphControl:
-    def test_start(self, provider_with_docker, mock_xmlrpc_mw):
-        provider_with_docker._xmlrpc = mock_xmlrpc_mw
-        assert provider_with_docker.start() is True
-        mock_xmlrpc_mw.start.assert_called_once()
-
-    def test_stop(self, provider_with_docker, mock_xmlrpc_mw):
-        provider_with_docker._xmlrpc = mock_xmlrpc_mw
-        assert provider_with_docker.stop() is True
-        mock_xmlrpc_mw.stop.assert_called_once()
-
-    def test_lock(self, provider_with_docker, mock_xmlrpc_mw):
-        provider_with_docker._xmlrpc = mock_xmlrpc_mw
-        assert provider_with_docker.lock() is True
-        mock_xmlrpc_mw.lock.assert_called_once()
-
-    def test_unlock(self, provider_with_docker, mock_xmlrpc_mw):
+    @pytest.mark.parametrize("method", ["start", "stop", "lock", "unlock"])
+    def test_control_delegates_to_xmlrpc(
+        self, provider_with_docker, mock_xmlrpc_mw, method
+    ):
         provider_with_docker._xmlrpc = mock_xmlrpc_mw
-        assert provider_with_docker.unlock() is True
-        mock_xmlrpc_mw.unlock.assert_called_once()
+        assert getattr(provider_with_docker, method)() is True
+        getattr(mock_xmlrpc_mw, method).assert_called_once()
 
     def test_flowgraph_control_requires_connection(self, provider_with_docker):
         with pytest.raises(RuntimeError, match="Not connected"):
@@ -348,51 +368,67 @@ class TestVisualFeedback:
 class TestCoverageCollection:
     """Tests for coverage collection methods."""
 
-    def test_launch_with_coverage(self, provider_with_docker, mock_docker_mw, tmp_path):
-        fg = tmp_path / "test.grc"
-        fg.write_text("<flowgraph/>")
+    @pytest.fixture(autouse=True)
+    def coverage_base(self, tmp_path, monkeypatch):
+        """Point the provider's host coverage directory at tmp_path."""
+        monkeypatch.setattr(
+            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
+        )
+        return tmp_path
+
+    @pytest.fixture
+    def fake_run(self, monkeypatch):
+        """Install a subprocess.run stand-in for the coverage CLI.
 
+        Returns an installer taking the stdout to report and an optional
+        ``on_call(cmd)`` hook for creating the files a command would write.
+        """
+
+        def install(stdout="", on_call=None):
+            def run(cmd, **kwargs):
+                if on_call is not None:
+                    on_call(cmd)
+                return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+            monkeypatch.setattr("subprocess.run", run)
+
+        return install
+
+    def test_launch_with_coverage(self, provider_with_docker, mock_docker_mw):
         provider_with_docker.launch_flowgraph(
-            flowgraph_path=str(fg),
+            flowgraph_path=FLOWGRAPH_PATH,
             name="cov-test",
             enable_coverage=True,
         )
 
-        mock_docker_mw.launch.assert_called_once()
-        call_kwargs = mock_docker_mw.launch.call_args.kwargs
-        assert call_kwargs["enable_coverage"] is True
+        assert_launched_with(
+            mock_docker_mw,
+            flowgraph_path=FLOWGRAPH_PATH,
+            name="cov-test",
+            enable_coverage=True,
+        )
 
     def test_collect_coverage_no_data(self, provider_with_docker):
         with pytest.raises(FileNotFoundError, match="No coverage data"):
             provider_with_docker.collect_coverage("nonexistent-container")
 
     def test_collect_coverage_success(
-        self, provider_with_docker, tmp_path, monkeypatch
+        self, provider_with_docker, coverage_base, fake_run
     ):
         from gnuradio_mcp.models import CoverageDataModel
 
         # Create fake coverage directory and file
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-        coverage_dir = tmp_path / "test-container"
+        coverage_dir = coverage_base / "test-container"
         coverage_dir.mkdir()
         (coverage_dir / ".coverage").write_bytes(b"fake coverage data")
 
         # Mock subprocess to return fake coverage report
-        def mock_run(cmd, **kwargs):
-            class FakeResult:
-                stdout = """Name          Stmts   Miss Branch BrPart  Cover
+        report = """Name          Stmts   Miss Branch BrPart  Cover
 -----------------------------------------------
 module.py        100     20     40     10    75%
 -----------------------------------------------
 TOTAL            100     20     40     10    75%"""
-                stderr = ""
-                returncode = 0
-
-            return FakeResult()
-
-        monkeypatch.setattr("subprocess.run", mock_run)
+        fake_run(stdout=report)
 
         result = provider_with_docker.collect_coverage("test-container")
 
@@ -402,105 +438,63 @@ TOTAL            100     20     40     10    75%"""
         assert result.lines_total == 100
         assert result.lines_covered == 80  # 100 - 20 missed
 
-    def test_generate_coverage_report_html(
-        self, provider_with_docker, tmp_path, monkeypatch
+    @pytest.mark.parametrize(
+        "fmt,expected_path", [("html", "htmlcov"), ("xml", "coverage.xml")]
+    )
+    def test_generate_coverage_report(
+        self, provider_with_docker, coverage_base, fake_run, fmt, expected_path
     ):
         from gnuradio_mcp.models import CoverageReportModel
 
-        # Setup
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-        coverage_dir = tmp_path / "test-container"
+        coverage_dir = coverage_base / "test-container"
         coverage_dir.mkdir()
         (coverage_dir / ".coverage").write_bytes(b"fake coverage data")
 
-        # Mock subprocess
-        def mock_run(cmd, **kwargs):
-            class FakeResult:
-                returncode = 0
-
-            # Create output file for HTML
+        # Create output file for HTML
+        def write_html(cmd):
             if "html" in cmd:
                 html_dir = coverage_dir / "htmlcov"
                 html_dir.mkdir(exist_ok=True)
                 (html_dir / "index.html").write_text("<html>Coverage</html>")
-            return FakeResult()
-
-        monkeypatch.setattr("subprocess.run", mock_run)
-
-        result = provider_with_docker.generate_coverage_report("test-container", "html")
-
-        assert isinstance(result, CoverageReportModel)
-        assert result.format == "html"
-        assert "htmlcov" in result.report_path
-
-    def test_generate_coverage_report_xml(
-        self, provider_with_docker, tmp_path, monkeypatch
-    ):
-        from gnuradio_mcp.models import CoverageReportModel
-
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-        coverage_dir = tmp_path / "test-container"
-        coverage_dir.mkdir()
-        (coverage_dir / ".coverage").write_bytes(b"fake coverage data")
 
-        def mock_run(cmd, **kwargs):
-            class FakeResult:
-                returncode = 0
+        fake_run(on_call=write_html)
 
-            return FakeResult()
-
-        monkeypatch.setattr("subprocess.run", mock_run)
-
-        result = provider_with_docker.generate_coverage_report("test-container", "xml")
+        result = provider_with_docker.generate_coverage_report("test-container", fmt)
 
         assert isinstance(result, CoverageReportModel)
-        assert result.format == "xml"
-        assert "coverage.xml" in result.report_path
+        assert result.format == fmt
+        assert expected_path in result.report_path
 
     def test_generate_coverage_report_requires_coverage_file(
-        self, provider_with_docker, tmp_path, monkeypatch
+        self, provider_with_docker, coverage_base
     ):
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-        coverage_dir = tmp_path / "test-container"
+        coverage_dir = coverage_base / "test-container"
         coverage_dir.mkdir()
         # No .coverage file
 
         with pytest.raises(FileNotFoundError, match="No combined coverage file"):
             provider_with_docker.generate_coverage_report("test-container", "html")
 
-    def test_combine_coverage(self, provider_with_docker, tmp_path, monkeypatch):
+    def test_combine_coverage(self, provider_with_docker, coverage_base, fake_run):
         from gnuradio_mcp.models import CoverageDataModel
 
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-
         # Create two containers with coverage data
         for name in ["container-1", "container-2"]:
-            coverage_dir = tmp_path / name
+            coverage_dir = coverage_base / name
             coverage_dir.mkdir()
             (coverage_dir / ".coverage").write_bytes(b"fake coverage")
 
-        def mock_run(cmd, **kwargs):
-            class FakeResult:
-                stdout = "TOTAL            200     40     80     20    75%"
-                stderr = ""
-                returncode = 0
-
-            # Create combined coverage file
+        # Create combined coverage file
+        def write_combined(cmd):
             if "combine" in cmd:
-                combined_dir = tmp_path / "combined"
+                combined_dir = coverage_base / "combined"
                 combined_dir.mkdir(exist_ok=True)
                 (combined_dir / ".coverage").write_bytes(b"combined data")
-            return FakeResult()
 
-        monkeypatch.setattr("subprocess.run", mock_run)
+        fake_run(
+            stdout="TOTAL            200     40     80     20    75%",
+            on_call=write_combined,
+        )
 
         result = provider_with_docker.combine_coverage(["container-1", "container-2"])
 
@@ -511,41 +505,40 @@ TOTAL            100     20     40     10    75%"""
         with pytest.raises(ValueError, match="At least one container"):
             provider_with_docker.combine_coverage([])
 
-    def test_delete_coverage_specific(
-        self, provider_with_docker, tmp_path, monkeypatch
+    @pytest.mark.parametrize(
+        "kwargs,expected_deleted,remaining",
+        [
+            ({"name": "container-1"}, 1, {"container-2"}),
+            ({}, 2, set()),
+            ({"name": "nonexistent"}, 0, {"container-1", "container-2"}),
+        ],
+        ids=["specific", "all", "nonexistent"],
+    )
+    def test_delete_coverage(
+        self, provider_with_docker, coverage_base, kwargs, expected_deleted, remaining
     ):
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-
-        # Create coverage directory
-        coverage_dir = tmp_path / "test-container"
-        coverage_dir.mkdir()
-        (coverage_dir / ".coverage").write_bytes(b"data")
+        for name in ["container-1", "container-2"]:
+            coverage_dir = coverage_base / name
+            coverage_dir.mkdir()
+            (coverage_dir / ".coverage").write_bytes(b"data")
 
-        deleted = provider_with_docker.delete_coverage(name="test-container")
+        deleted = provider_with_docker.delete_coverage(**kwargs)
 
-        assert deleted == 1
-        assert not coverage_dir.exists()
+        assert deleted == expected_deleted
+        assert {p.name for p in coverage_base.iterdir()} == remaining
 
-    def test_delete_coverage_older_than(
-        self, provider_with_docker, tmp_path, monkeypatch
-    ):
+    def test_delete_coverage_older_than(self, provider_with_docker, coverage_base):
         import os
         import time
 
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-
         # Create old and new coverage directories
-        old_dir = tmp_path / "old-container"
+        old_dir = coverage_base / "old-container"
         old_dir.mkdir()
         # Set mtime to 10 days ago
         old_time = time.time() - (10 * 86400)
         os.utime(old_dir, (old_time, old_time))
 
-        new_dir = tmp_path / "new-container"
+        new_dir = coverage_base / "new-container"
         new_dir.mkdir()
 
         deleted = provider_with_docker.delete_coverage(older_than_days=7)
@@ -554,51 +547,28 @@ TOTAL            100     20     40     10    75%"""
         assert not old_dir.exists()
         assert new_dir.exists()
 
-    def test_delete_coverage_all(self, provider_with_docker, tmp_path, monkeypatch):
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-
-        # Create multiple directories
-        (tmp_path / "container-1").mkdir()
-        (tmp_path / "container-2").mkdir()
-
-        deleted = provider_with_docker.delete_coverage()
-
-        assert deleted == 2
-        assert not (tmp_path / "container-1").exists()
-        assert not (tmp_path / "container-2").exists()
-
-    def test_delete_coverage_nonexistent(
-        self, provider_with_docker, tmp_path, monkeypatch
-    ):
-        monkeypatch.setattr(
-            "gnuradio_mcp.providers.runtime.HOST_COVERAGE_BASE", str(tmp_path)
-        )
-        # tmp_path exists but is empty
-
-        deleted = provider_with_docker.delete_coverage(name="nonexistent")
-        assert deleted == 0
-
-    def test_parse_coverage_summary(self, provider_with_docker):
-        summary = """Name          Stmts   Miss Branch BrPart  Cover
+    @pytest.mark.parametrize(
+        "summary,expected",
+        [
+            (
+                """Name          Stmts   Miss Branch BrPart  Cover
 -----------------------------------------------
 module.py        150     30     60     15    80%
 other.py          50     20     20      5    60%
 -----------------------------------------------
-TOTAL            200     50     80     20    75%"""
-
-        metrics = provider_with_docker._parse_coverage_summary(summary)
-
-        assert metrics["lines_total"] == 200
-        assert metrics["lines_covered"] == 150  # 200 - 50 missed
-        assert metrics["coverage_percent"] == 75.0
-
-    def test_parse_coverage_summary_no_total(self, provider_with_docker):
-        summary = "No coverage data collected"
-
+TOTAL            200     50     80     20    75%""",
+                # 200 - 50 missed
+                {"lines_total": 200, "lines_covered": 150, "coverage_percent": 75.0},
+            ),
+            (
+                "No coverage data collected",
+                {"lines_total": None, "lines_covered": None, "coverage_percent": None},
+            ),
+        ],
+        ids=["total", "no_total"],
+    )
+    def test_parse_coverage_summary(self, provider_with_docker, summary, expected):
         metrics = provider_with_docker._parse_coverage_summary(summary)
 
-        assert metrics["lines_total"] is None
-        assert metrics["lines_covered"] is None
-        assert metrics["coverage_percent"] is None
+        for key, value in expected.items():
+            assert metrics[key] == value
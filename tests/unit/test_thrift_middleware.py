@@ -51,34 +51,50 @@ class MockKnobProps:
         )
 
 
+# Canned client responses; ThriftMiddleware only reads them, so the same
+# dicts are handed to every test
+DEFAULT_KNOBS = {
+    "sig_source0::frequency": MockKnob("sig_source0::frequency", 1000000.0, 5),
+    "sig_source0::amplitude": MockKnob("sig_source0::amplitude", 0.5, 5),
+    "null_sink0::avg throughput": MockKnob("null_sink0::avg throughput", 1e9, 5),
+}
+DEFAULT_RE_KNOBS = {
+    "sig_source0::frequency": MockKnob("sig_source0::frequency", 1000000.0, 5),
+}
+DEFAULT_PROPERTIES = {
+    "sig_source0::frequency": MockKnobProps(
+        description="Signal frequency in Hz",
+        units="Hz",
+        ktype=5,
+        min_val=0.0,
+        max_val=1e12,
+        default_val=1000.0,
+    ),
+}
+PERF_KNOBS = {
+    "sig_source0::frequency": MockKnob("sig_source0::frequency", 1e6, 5),
+    "sig_source0::avg throughput": MockKnob("sig_source0::avg throughput", 1e9, 5),
+    "sig_source0::avg work time": MockKnob("sig_source0::avg work time", 100.0, 5),
+    "sig_source0::total work time": MockKnob(
+        "sig_source0::total work time", 10000.0, 5
+    ),
+    "sig_source0::avg nproduced": MockKnob("sig_source0::avg nproduced", 4096.0, 5),
+    "null_sink0::avg throughput": MockKnob("null_sink0::avg throughput", 5e8, 5),
+}
+
+
 @pytest.fixture
 def mock_client():
     """Create a mock Thrift client."""
-    client = MagicMock()
-
-    # Default getKnobs response
-    client.getKnobs.return_value = {
-        "sig_source0::frequency": MockKnob("sig_source0::frequency", 1000000.0, 5),
-        "sig_source0::amplitude": MockKnob("sig_source0::amplitude", 0.5, 5),
-        "null_sink0::avg throughput": MockKnob("null_sink0::avg throughput", 1e9, 5),
-    }
-
-    # Default getRe response (regex query)
-    client.getRe.return_value = {
-        "sig_source0::frequency": MockKnob("sig_source0::frequency", 1000000.0, 5),
-    }
-
-    # Default properties response
-    client.properties.return_value = {
-        "sig_source0::frequency": MockKnobProps(
-            description="Signal frequency in Hz",
-            units="Hz",
-            ktype=5,
-            min_val=0.0,
-            max_val=1e12,
-            default_val=1000.0,
-        ),
-    }
+    # The RPCConnectionThrift calls ThriftMiddleware makes; anything else
+    # raises instead of silently returning a child mock
+    client = MagicMock(
+        spec_set=["getKnobs", "getRe", "setKnobs", "properties", "postMessage"]
+    )
+
+    client.getKnobs.return_value = DEFAULT_KNOBS
+    client.getRe.return_value = DEFAULT_RE_KNOBS
+    client.properties.return_value = DEFAULT_PROPERTIES
 
     return client
 
@@ -226,24 +242,7 @@ class TestThriftMiddlewarePerfCounters:
 
     def test_get_performance_counters(self, thrift_middleware, mock_client):
         """get_performance_counters extracts per-block metrics."""
-        mock_client.getKnobs.return_value = {
-            "sig_source0::frequency": MockKnob("sig_source0::frequency", 1e6, 5),
-            "sig_source0::avg throughput": MockKnob(
-                "sig_source0::avg throughput", 1e9, 5
-            ),
-            "sig_source0::avg work time": MockKnob(
-                "sig_source0::avg work time", 100.0, 5
-            ),
-            "sig_source0::total work time": MockKnob(
-                "sig_source0::total work time", 10000.0, 5
-            ),
-            "sig_source0::avg nproduced": MockKnob(
-                "sig_source0::avg nproduced", 4096.0, 5
-            ),
-            "null_sink0::avg throughput": MockKnob(
-                "null_sink0::avg throughput", 5e8, 5
-            ),
-        }
+        mock_client.getKnobs.return_value = PERF_KNOBS
 
         counters = thrift_middleware.get_performance_counters()
 
@@ -327,13 +326,12 @@ class TestKnobTypeNames:
 
     def test_all_perf_counter_suffixes_defined(self):
         """Ensure all expected perf counter suffixes are defined."""
-        expected_suffixes = [
+        expected_suffixes = {
             "::avg throughput",
             "::avg work time",
             "::total work time",
             "::avg nproduced",
             "::avg input % full",
             "::avg output % full",
-        ]
-        for suffix in expected_suffixes:
-            assert suffix in PERF_COUNTER_SUFFIXES
+        }
+        assert expected_suffixes <= set(PERF_COUNTER_SUFFIXES)
@@ -7,23 +7,26 @@ import pytest
 from gnuradio_mcp.middlewares.xmlrpc import XmlRpcMiddleware
 from gnuradio_mcp.models import ConnectionInfoModel, VariableModel
 
+# Introspection result; XmlRpcMiddleware only iterates it
+LIST_METHODS = (
+    "system.listMethods",
+    "system.methodHelp",
+    "get_frequency",
+    "set_frequency",
+    "get_amplitude",
+    "set_amplitude",
+    "get_waveform",
+    "start",
+    "stop",
+    "lock",
+    "unlock",
+)
+
 
 @pytest.fixture
 def mock_proxy():
     proxy = MagicMock()
-    proxy.system.listMethods.return_value = [
-        "system.listMethods",
-        "system.methodHelp",
-        "get_frequency",
-        "set_frequency",
-        "get_amplitude",
-        "set_amplitude",
-        "get_waveform",
-        "start",
-        "stop",
-        "lock",
-        "unlock",
-    ]
+    proxy.system.listMethods.return_value = LIST_METHODS
     return proxy
 
 
@@ -116,18 +119,7 @@ class TestGetSetVariable:
 
 
 class TestFlowgraphControl:
-    def test_start(self, xmlrpc_mw, mock_proxy):
-        assert xmlrpc_mw.start() is True
-        mock_proxy.start.assert_called_once()
-
-    def test_stop(self, xmlrpc_mw, mock_proxy):
-        assert xmlrpc_mw.stop() is True
-        mock_proxy.stop.assert_called_once()
-
-    def test_lock(self, xmlrpc_mw, mock_proxy):
-        assert xmlrpc_mw.lock() is True
-        mock_proxy.lock.assert_called_once()
-
-    def test_unlock(self, xmlrpc_mw, mock_proxy):
-        assert xmlrpc_mw.unlock() is True
-        mock_proxy.unlock.assert_called_once()
+    @pytest.mark.parametrize("method", ["start", "stop", "lock", "unlock"])
+    def test_control_delegates_to_proxy(self, xmlrpc_mw, mock_proxy, method):
+        assert getattr(xmlrpc_mw, method)() is True
+        getattr(mock_proxy, method).assert_called_once()